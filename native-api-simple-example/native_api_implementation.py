@@ -4,68 +4,297 @@ Catalyst Center Native API Implementation
 Equivalent to NAC Module YAML Configuration
 """
 
+import argparse
 import requests
 import json
-from typing import Dict, List
+import ssl
+import time
+import threading
+import functools
+from concurrent.futures import ThreadPoolExecutor
+from typing import Dict, List, Optional
 import urllib3
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+
+# orjson is a faster drop-in when installed; stdlib json otherwise
+try:
+    import orjson
+    _json_dumps = orjson.dumps
+    _json_loads = orjson.loads
+except ImportError:
+    def _json_dumps(obj) -> bytes:
+        return json.dumps(obj).encode()
+    _json_loads = json.loads
+
+# ijson (optional) streams large site lists instead of loading them whole
+try:
+    import ijson
+except ImportError:
+    ijson = None
+
+# Reservation pools: (name suffix, global pool, second octet)
+POOLS = [
+    ("CORP", "US_CORP", "201"),
+    ("TECH", "US_TECH", "202"),
+    ("GUEST", "US_GUEST", "203"),
+    ("BYOD", "US_BYOD", "204"),
+]
+
+class _SSLContextAdapter(HTTPAdapter):
+    """HTTPAdapter whose pooled connections share one SSLContext, with its CA certificates loaded once"""
+    
+    def __init__(self, ssl_context: Optional[ssl.SSLContext] = None, **kwargs):
+        # Set before super().__init__, which builds the pool manager
+        self.ssl_context = ssl_context
+        # Per-thread override of max_retries (see send_once)
+        self._local = threading.local()
+        super().__init__(**kwargs)
+    
+    @property
+    def max_retries(self):
+        return getattr(self._local, "retries", None) or self._max_retries
+    
+    @max_retries.setter
+    def max_retries(self, retries):
+        self._max_retries = retries
+    
+    def init_poolmanager(self, *args, **kwargs):
+        if self.ssl_context is not None:
+            kwargs["ssl_context"] = self.ssl_context
+        super().init_poolmanager(*args, **kwargs)
+    
+    def cert_verify(self, conn, url, verify, cert):
+        super().cert_verify(conn, url, verify, cert)
+        if self.ssl_context is not None and verify:
+            # The shared context already holds the CA; a path here would make urllib3
+            # load it into that context again for every new connection
+            conn.ca_certs = None
+            conn.ca_cert_dir = None
+    
+    def send_once(self, request, **kwargs):
+        """send() on the shared pool, but with no retries or backoff for this one call"""
+        self._local.retries = Retry(0, read=False)
+        try:
+            return self.send(request, **kwargs)
+        finally:
+            self._local.retries = None
 
-# Disable SSL warnings for demo
-urllib3.disable_warnings(urllib3.exceptions.InsecureRequestWarning)
 
 class CatalystCenterAPI:
-    def __init__(self, base_url: str, username: str, password: str):
+    # Concurrent calls in _bulk; the connection pool is sized to match
+    MAX_WORKERS = 8
+    # Refresh the token before its 60-minute lifetime runs out
+    TOKEN_TTL_SEC = 55 * 60
+    # Long-poll query for task GETs; servers that ignore it just answer at once
+    LONG_POLL_PARAMS = {"waitFor": "completion", "timeout": 30}
+    
+    def __init__(self, base_url: str, username: str, password: str, ca_bundle: Optional[str] = None):
         self.base_url = base_url
+        # Endpoint URLs, built once instead of on every call
+        self._urls = {
+            "auth": f"{base_url}/dna/system/api/v1/auth/token",
+            "site": f"{base_url}/dna/intent/api/v1/site",
+            "pool": f"{base_url}/dna/intent/api/v1/global-pool",
+            "reservations": f"{base_url}/dna/intent/api/v1/reserve-ip-subpool",
+            "reserve": f"{base_url}/dna/intent/api/v1/reserve-ip-subpool/",
+            "task": f"{base_url}/dna/intent/api/v1/task/",
+        }
         self.username = username
         self.password = password
         self.token = None
+        self._token_acquired_at = 0.0
+        self._auth_lock = threading.Lock()
         self.headers = {"Content-Type": "application/json"}
         
+        # One keep-alive session for all calls (reuses the TCP+TLS connection).
+        # pool_block keeps parallel calls on the pooled connections instead of
+        # opening extra ones that are discarded after a single request.
+        self.session = requests.Session()
+        ssl_context = None
+        if ca_bundle:
+            # Verify against the Catalyst Center CA and reuse one context for all connections
+            ssl_context = ssl.create_default_context(cafile=ca_bundle)
+            ssl_context.minimum_version = ssl.TLSVersion.TLSv1_2
+        adapter = _SSLContextAdapter(
+            ssl_context=ssl_context,
+            pool_connections=16,
+            pool_maxsize=self.MAX_WORKERS,
+            pool_block=True,
+            # Retry throttling and transient server errors instead of aborting the run
+            max_retries=Retry(
+                total=5,
+                backoff_factor=0.5,
+                status_forcelist=(429, 500, 502, 503, 504),
+                allowed_methods=frozenset({"GET", "HEAD", "POST"}),
+                respect_retry_after_header=True
+            )
+        )
+        self.session.mount("https://", adapter)
+        self._adapter = adapter
+        # Verification is configured once on the session; with trust_env on, requests would
+        # replace it with REQUESTS_CA_BUNDLE/CURL_CA_BUNDLE on every call
+        self.session.trust_env = False
+        if ca_bundle:
+            self.session.verify = ca_bundle
+        else:
+            # No CA bundle (lab with self-signed cert): skip verification and its warnings
+            self.session.verify = False
+            urllib3.disable_warnings(urllib3.exceptions.InsecureRequestWarning)
+        self.session.headers.update(self.headers)
+        
+        # Worker threads shared by every _bulk phase (started once, not per phase)
+        self._executor = ThreadPoolExecutor(max_workers=self.MAX_WORKERS)
+        
+        # Cleared the first time the task endpoint rejects LONG_POLL_PARAMS
+        self._long_poll = True
+        
+        # Site name -> ID, built from one site-list GET and reset after site creates
+        self._site_index: Optional[Dict[str, str]] = None
+        
+        # Resolve DNS and open the first TLS connection while the caller gets ready
+        self._warmup = self._executor.submit(self._warm_connection)
+    
+    def _warm_connection(self):
+        """Open and pool a connection so authenticate() does not pay the handshake"""
+        # Sent without the session's retries: a failing "/" must not delay authenticate() with backoff
+        request = self.session.prepare_request(requests.Request("HEAD", self.base_url + "/"))
+        try:
+            self._adapter.send_once(request, timeout=3, verify=self.session.verify).close()
+        except requests.RequestException:
+            pass  # Warm-up is best effort; authenticate() connects on its own
+    
     def authenticate(self):
         """Get authentication token"""
-        auth_url = f"{self.base_url}/dna/system/api/v1/auth/token"
-        response = requests.post(
-            auth_url,
-            auth=(self.username, self.password),
-            verify=False
+        if self._warmup is not None:
+            self._warmup.result()
+            self._warmup = None
+        response = self.session.post(
+            self._urls["auth"],
+            auth=(self.username, self.password)
         )
-        self.token = response.json()["Token"]
+        self.token = _json_loads(response.content)["Token"]
         self.headers["X-Auth-Token"] = self.token
+        self.session.headers["X-Auth-Token"] = self.token
+        self._token_acquired_at = time.monotonic()
         return self.token
     
+    def _refresh_token(self, stale_token: str):
+        """Re-authenticate once, even when several threads hit the same stale token"""
+        with self._auth_lock:
+            if self.token == stale_token:
+                self.authenticate()
+    
+    def _request(self, method: str, url: str, **kwargs) -> requests.Response:
+        """Send a request, re-authenticating on token expiry or a 401"""
+        if self.token and time.monotonic() - self._token_acquired_at > self.TOKEN_TTL_SEC:
+            self._refresh_token(self.token)
+        token = self.token
+        response = self.session.request(method, url, **kwargs)
+        if response.status_code == 401:
+            # Hand the connection back to the pool (stream=True callers have not read the body)
+            response.close()
+            self._refresh_token(token)
+            response = self.session.request(method, url, **kwargs)
+        return response
+    
+    def _get(self, url: str, **kwargs) -> Dict:
+        """GET a URL and decode the JSON response"""
+        response = self._request("GET", url, **kwargs)
+        return _json_loads(response.content)
+    
+    def _post(self, url: str, payload: Dict, wait: bool = True, parse: bool = True):
+        """POST a pre-serialized JSON payload and optionally wait for its task
+        
+        With parse=False only the status code is returned; the body is decoded
+        just when wait=True needs the task ID from it.
+        """
+        response = self._request("POST", url, data=_json_dumps(payload))
+        if not (wait or parse):
+            return response.status_code
+        result = _json_loads(response.content)
+        task_id = self.task_id_of(result)
+        if wait and task_id:
+            self.wait_for_task(task_id)
+        return result if parse else response.status_code
+    
+    def _iter_sites(self):
+        """Yield every site from the site list, parsed incrementally when ijson is available"""
+        url = self._urls["site"]
+        if ijson is None:
+            yield from self._get(url)["response"]
+            return
+        response = self._request("GET", url, stream=True)
+        try:
+            response.raw.decode_content = True
+            yield from ijson.items(response.raw, "response.item")
+        finally:
+            response.close()
+    
+    def _ensure_site_index(self):
+        """Build the site name -> ID index with a single site-list GET"""
+        if self._site_index is None:
+            # Keep the first match per name, like the original linear scan
+            index = {}
+            for site in self._iter_sites():
+                index.setdefault(site["name"], site["id"])
+            self._site_index = index
+    
     def get_site_id(self, site_name: str) -> str:
-        """Get site ID by name"""
-        url = f"{self.base_url}/dna/intent/api/v1/site"
-        response = requests.get(url, headers=self.headers, verify=False)
-        sites = response.json()["response"]
-        for site in sites:
-            if site["name"] == site_name:
-                return site["id"]
-        return None
+        """Get site ID by name (cached)"""
+        self._ensure_site_index()
+        return self._site_index.get(site_name)
+    
+    def prefetch_site_ids(self, names: List[str]) -> Dict[str, str]:
+        """Get several site IDs by name with at most one site-list GET"""
+        self._ensure_site_index()
+        return {name: self._site_index.get(name) for name in names}
+    
+    def list_site_names(self) -> set:
+        """Get the full hierarchy names of existing sites (floor names alone repeat)"""
+        return {site.get("siteNameHierarchy") for site in self._iter_sites()}
     
     # ==========================================================================
     # IP POOL OPERATIONS
     # ==========================================================================
     
-    def create_ip_pool(self, pool_data: Dict) -> str:
+    def list_pool_names(self) -> set:
+        """Get the names of existing global IP pools"""
+        pools = self._get(self._urls["pool"]).get("response", [])
+        return {pool.get("ipPoolName") for pool in pools}
+    
+    def list_reservation_names(self, site_id: str) -> set:
+        """Get the names of existing IP pool reservations for a site"""
+        reservations = self._get(self._urls["reservations"], params={"siteId": site_id}).get("response", [])
+        return {reservation.get("groupName") for reservation in reservations}
+    
+    def create_ip_pool(self, pool_data: Dict, wait: bool = True, parse: bool = True) -> str:
         """Create global IP pool"""
-        url = f"{self.base_url}/dna/intent/api/v1/global-pool"
+        url = self._urls["pool"]
         # Simplified payload - only name and CIDR
         # DHCP/DNS servers cause validation errors during creation
         payload = {
             "ipPoolName": pool_data["name"],
             "ipPoolCidr": pool_data["ip_pool_cidr"]
         }
-        response = requests.post(
-            url, 
-            headers=self.headers, 
-            json=payload, 
-            verify=False
-        )
-        return response.json()
+        return self._post(url, payload, wait, parse)
     
-    def reserve_ip_pool(self, site_id: str, reservation_data: Dict) -> str:
+    def create_ip_pools(self, pools: List[Dict], wait: bool = True, parse: bool = True) -> str:
+        """Create several global IP pools with a single POST"""
+        url = self._urls["pool"]
+        payload = {
+            "settings": {
+                "ippool": [
+                    {"ipPoolName": pool["name"], "ipPoolCidr": pool["ip_pool_cidr"]}
+                    for pool in pools
+                ]
+            }
+        }
+        return self._post(url, payload, wait, parse)
+    
+    def reserve_ip_pool(self, site_id: str, reservation_data: Dict, wait: bool = True, parse: bool = True) -> str:
         """Reserve IP pool for a site"""
-        url = f"{self.base_url}/dna/intent/api/v1/reserve-ip-subpool/{site_id}"
+        url = self._urls["reserve"] + site_id
         payload = {
             "name": reservation_data["name"],
             "type": "Generic",
@@ -73,125 +302,118 @@ class CatalystCenterAPI:
             "ipv4Prefix": True,
             "ipv4PrefixLength": reservation_data["prefix_length"],
             "ipv4Subnet": reservation_data["subnet"],
-            "ipv4GateWay": f"{reservation_data['subnet'].rsplit('.', 1)[0]}.1",
+            "ipv4GateWay": reservation_data.get("gateway") or f"{reservation_data['subnet'].rsplit('.', 1)[0]}.1",
             "ipv4DhcpServers": reservation_data["dhcp_servers"],
             "ipv4DnsServers": reservation_data["dns_servers"]
         }
-        response = requests.post(
-            url,
-            headers=self.headers,
-            json=payload,
-            verify=False
-        )
-        return response.json()
+        return self._post(url, payload, wait, parse)
     
     # ==========================================================================
     # SITE OPERATIONS
     # ==========================================================================
     
-    def create_area(self, area_data: Dict) -> str:
+    def _create_site(self, kind: str, inner: Dict, wait: bool = True, parse: bool = True) -> str:
+        """Create an area, building or floor from its inner site payload"""
+        url = self._urls["site"]
+        payload = {"type": kind, "site": {kind: inner}}
+        result = self._post(url, payload, wait, parse)
+        self._site_index = None
+        return result
+    
+    def create_area(self, area_data: Dict, wait: bool = True, parse: bool = True) -> str:
         """Create area in site hierarchy"""
-        url = f"{self.base_url}/dna/intent/api/v1/site"
-        
-        # Get parent site ID
-        parent_id = self.get_site_id(area_data["parent_name"])
-        
-        payload = {
-            "type": "area",
-            "site": {
-                "area": {
-                    "name": area_data["name"],
-                    "parentName": area_data["parent_name"]
-                }
-            }
-        }
-        response = requests.post(
-            url,
-            headers=self.headers,
-            json=payload,
-            verify=False
-        )
-        return response.json()
+        return self._create_site("area", {
+            "name": area_data["name"],
+            "parentName": area_data["parent_name"]
+        }, wait, parse)
     
-    def create_building(self, building_data: Dict) -> str:
+    def create_building(self, building_data: Dict, wait: bool = True, parse: bool = True) -> str:
         """Create building in site hierarchy"""
-        url = f"{self.base_url}/dna/intent/api/v1/site"
-        
-        payload = {
-            "type": "building",
-            "site": {
-                "building": {
-                    "name": building_data["name"],
-                    "parentName": building_data["parent_name"],
-                    "latitude": building_data["latitude"],
-                    "longitude": building_data["longitude"],
-                    "address": building_data["address"],
-                    "country": building_data["country"]
-                }
-            }
-        }
-        response = requests.post(
-            url,
-            headers=self.headers,
-            json=payload,
-            verify=False
-        )
-        
-        # Wait for task completion
-        task_id = response.json()["executionId"]
-        self.wait_for_task(task_id)
-        
-        return response.json()
-    
-    def create_floor(self, floor_data: Dict) -> str:
+        return self._create_site("building", {
+            "name": building_data["name"],
+            "parentName": building_data["parent_name"],
+            "latitude": building_data["latitude"],
+            "longitude": building_data["longitude"],
+            "address": building_data["address"],
+            "country": building_data["country"]
+        }, wait, parse)
+    
+    def create_floor(self, floor_data: Dict, wait: bool = True, parse: bool = True) -> str:
         """Create floor in site hierarchy"""
-        url = f"{self.base_url}/dna/intent/api/v1/site"
-        
-        payload = {
-            "type": "floor",
-            "site": {
-                "floor": {
-                    "name": floor_data["name"],
-                    "parentName": floor_data["parent_name"],
-                    "rfModel": "Cubes And Walled Offices",
-                    "width": 100,
-                    "length": 100,
-                    "height": 10,
-                    "floorNumber": floor_data["floor_number"]
-                }
-            }
-        }
-        response = requests.post(
-            url,
-            headers=self.headers,
-            json=payload,
-            verify=False
-        )
-        return response.json()
+        return self._create_site("floor", {
+            "name": floor_data["name"],
+            "parentName": floor_data["parent_name"],
+            "rfModel": "Cubes And Walled Offices",
+            "width": 100,
+            "length": 100,
+            "height": 10,
+            "floorNumber": floor_data["floor_number"]
+        }, wait, parse)
     
     def wait_for_task(self, task_id: str, max_attempts: int = 30):
-        """Poll task status until completion"""
-        url = f"{self.base_url}/dna/intent/api/v1/task/{task_id}"
+        """Wait for task completion (long-poll if supported, else backoff from 100ms up to 2s)"""
+        url = self._urls["task"] + task_id
+        delay = 0.1
         for _ in range(max_attempts):
-            response = requests.get(url, headers=self.headers, verify=False)
-            task = response.json()["response"]
+            params = self.LONG_POLL_PARAMS if self._long_poll else None
+            response = self._request("GET", url, params=params)
+            if params and response.status_code in (400, 404):
+                # Long-poll not supported: fall back to plain polling from now on
+                self._long_poll = False
+                response = self._request("GET", url)
+            task = _json_loads(response.content)["response"]
             if task["isError"]:
                 raise Exception(f"Task failed: {task.get('failureReason', 'Unknown error')}")
             if not task.get("isError") and task.get("endTime"):
                 return task
-            import time
-            time.sleep(2)
+            time.sleep(delay)
+            delay = min(delay * 2, 2.0)
         raise TimeoutError("Task did not complete in time")
+    
+    @staticmethod
+    def task_id_of(response_json: Dict) -> Optional[str]:
+        """Get the task ID from an async response (executionId or response.taskId)"""
+        if response_json.get("executionId"):
+            return response_json["executionId"]
+        inner = response_json.get("response")
+        if isinstance(inner, dict):
+            return inner.get("taskId")
+        return None
+    
+    def _bulk(self, fn, items: List) -> List:
+        """Run fn over independent items concurrently, then wait for all their tasks
+        
+        fn must accept wait=False.
+        """
+        results = list(self._executor.map(functools.partial(fn, wait=False), items))
+        task_ids = [task_id for task_id in map(self.task_id_of, results) if task_id]
+        list(self._executor.map(self.wait_for_task, task_ids))
+        # Deferred tasks may have created sites after the per-call index reset
+        self._site_index = None
+        return results
+    
+    def close(self):
+        """Stop the worker threads and close pooled connections"""
+        self._executor.shutdown()
+        self.session.close()
 
 
 def main():
     """Main execution - create all infrastructure"""
     
+    parser = argparse.ArgumentParser(description="Create the Catalyst Center demo infrastructure")
+    parser.add_argument(
+        '--ca-bundle',
+        help='CA certificate file to verify Catalyst Center against (default: no verification)'
+    )
+    args = parser.parse_args()
+    
     # Initialize API client
     cc = CatalystCenterAPI(
         base_url="https://198.18.129.100",
         username="admin",
-        password="C1sco12345"
+        password="C1sco12345",
+        ca_bundle=args.ca_bundle
     )
     
     # Authenticate
@@ -204,41 +426,51 @@ def main():
     
     print("\nCreating IP Pools...")
     
-    # US_CORP Pool
-    cc.create_ip_pool({
-        "name": "US_CORP",
-        "ip_address_space": "IPv4",
-        "ip_pool_cidr": "10.201.0.0/16",
-        "dhcp_servers": ["10.201.0.1"],
-        "dns_servers": ["10.201.0.1"]
-    })
-    
-    # US_TECH Pool
-    cc.create_ip_pool({
-        "name": "US_TECH",
-        "ip_address_space": "IPv4",
-        "ip_pool_cidr": "10.202.0.0/16",
-        "dhcp_servers": ["10.202.0.1"],
-        "dns_servers": ["10.202.0.1"]
-    })
-    
-    # US_GUEST Pool
-    cc.create_ip_pool({
-        "name": "US_GUEST",
-        "ip_address_space": "IPv4",
-        "ip_pool_cidr": "10.203.0.0/16",
-        "dhcp_servers": ["10.203.0.1"],
-        "dns_servers": ["10.203.0.1"]
-    })
-    
-    # US_BYOD Pool
-    cc.create_ip_pool({
-        "name": "US_BYOD",
-        "ip_address_space": "IPv4",
-        "ip_pool_cidr": "10.204.0.0/16",
-        "dhcp_servers": ["10.204.0.1"],
-        "dns_servers": ["10.204.0.1"]
-    })
+    # Skip anything that already exists, so re-runs only send what is missing
+    existing_pools = cc.list_pool_names()
+    pools = [pool for pool in [
+        # US_CORP Pool
+        {
+            "name": "US_CORP",
+            "ip_address_space": "IPv4",
+            "ip_pool_cidr": "10.201.0.0/16",
+            "dhcp_servers": ["10.201.0.1"],
+            "dns_servers": ["10.201.0.1"]
+        },
+        # US_TECH Pool
+        {
+            "name": "US_TECH",
+            "ip_address_space": "IPv4",
+            "ip_pool_cidr": "10.202.0.0/16",
+            "dhcp_servers": ["10.202.0.1"],
+            "dns_servers": ["10.202.0.1"]
+        },
+        # US_GUEST Pool
+        {
+            "name": "US_GUEST",
+            "ip_address_space": "IPv4",
+            "ip_pool_cidr": "10.203.0.0/16",
+            "dhcp_servers": ["10.203.0.1"],
+            "dns_servers": ["10.203.0.1"]
+        },
+        # US_BYOD Pool
+        {
+            "name": "US_BYOD",
+            "ip_address_space": "IPv4",
+            "ip_pool_cidr": "10.204.0.0/16",
+            "dhcp_servers": ["10.204.0.1"],
+            "dns_servers": ["10.204.0.1"]
+        },
+    ] if pool["name"] not in existing_pools]
+    if pools:
+        cc.create_ip_pools(pools, parse=False)
+    
+    # Sites are matched on their full hierarchy name
+    existing_sites = cc.list_site_names()
+    
+    def missing_sites(sites):
+        return [site for site in sites
+                if f"{site['parent_name']}/{site['name']}" not in existing_sites]
     
     # ==========================================================================
     # CREATE SITE HIERARCHY - AREAS
@@ -246,30 +478,16 @@ def main():
     
     print("\nCreating Areas...")
     
-    cc.create_area({
-        "name": "United States",
-        "parent_name": "Global"
-    })
-    
-    cc.create_area({
-        "name": "Golden Hills Campus",
-        "parent_name": "Global/United States"
-    })
-    
-    cc.create_area({
-        "name": "Lakefront Tower",
-        "parent_name": "Global/United States"
-    })
-    
-    cc.create_area({
-        "name": "Oceanfront Mansion",
-        "parent_name": "Global/United States"
-    })
+    # Parent area first, then its children in parallel
+    for area in missing_sites([{"name": "United States", "parent_name": "Global"}]):
+        cc.create_area(area, parse=False)
     
-    cc.create_area({
-        "name": "Desert Oasis Branch",
-        "parent_name": "Global/United States"
-    })
+    cc._bulk(cc.create_area, missing_sites([
+        {"name": "Golden Hills Campus", "parent_name": "Global/United States"},
+        {"name": "Lakefront Tower", "parent_name": "Global/United States"},
+        {"name": "Oceanfront Mansion", "parent_name": "Global/United States"},
+        {"name": "Desert Oasis Branch", "parent_name": "Global/United States"},
+    ]))
     
     # ==========================================================================
     # CREATE SITE HIERARCHY - BUILDINGS
@@ -277,41 +495,40 @@ def main():
     
     print("\nCreating Buildings...")
     
-    cc.create_building({
-        "name": "Sunset Tower",
-        "parent_name": "Global/United States/Golden Hills Campus",
-        "latitude": 34.099,
-        "longitude": -118.366,
-        "address": "8358 Sunset Blvd, Los Angeles, CA 90069",
-        "country": "United States"
-    })
-    
-    cc.create_building({
-        "name": "Windy City Plaza",
-        "parent_name": "Global/United States/Lakefront Tower",
-        "latitude": 41.878,
-        "longitude": -87.630,
-        "address": "233 S Wacker Dr, Chicago, IL 60606",
-        "country": "United States"
-    })
-    
-    cc.create_building({
-        "name": "Art Deco Mansion",
-        "parent_name": "Global/United States/Oceanfront Mansion",
-        "latitude": 25.782,
-        "longitude": -80.133,
-        "address": "123 Ocean Drive, Miami Beach, FL 33139",
-        "country": "United States"
-    })
-    
-    cc.create_building({
-        "name": "Desert Oasis Tower",
-        "parent_name": "Global/United States/Desert Oasis Branch",
-        "latitude": 33.448,
-        "longitude": -112.074,
-        "address": "1235 Cactus Ave, Phoenix, AZ 85001",
-        "country": "United States"
-    })
+    cc._bulk(cc.create_building, missing_sites([
+        {
+            "name": "Sunset Tower",
+            "parent_name": "Global/United States/Golden Hills Campus",
+            "latitude": 34.099,
+            "longitude": -118.366,
+            "address": "8358 Sunset Blvd, Los Angeles, CA 90069",
+            "country": "United States"
+        },
+        {
+            "name": "Windy City Plaza",
+            "parent_name": "Global/United States/Lakefront Tower",
+            "latitude": 41.878,
+            "longitude": -87.630,
+            "address": "233 S Wacker Dr, Chicago, IL 60606",
+            "country": "United States"
+        },
+        {
+            "name": "Art Deco Mansion",
+            "parent_name": "Global/United States/Oceanfront Mansion",
+            "latitude": 25.782,
+            "longitude": -80.133,
+            "address": "123 Ocean Drive, Miami Beach, FL 33139",
+            "country": "United States"
+        },
+        {
+            "name": "Desert Oasis Tower",
+            "parent_name": "Global/United States/Desert Oasis Branch",
+            "latitude": 33.448,
+            "longitude": -112.074,
+            "address": "1235 Cactus Ave, Phoenix, AZ 85001",
+            "country": "United States"
+        },
+    ]))
     
     # ==========================================================================
     # CREATE SITE HIERARCHY - FLOORS
@@ -319,41 +536,14 @@ def main():
     
     print("\nCreating Floors...")
     
-    cc.create_floor({
-        "name": "FLOOR_1",
-        "parent_name": "Global/United States/Golden Hills Campus/Sunset Tower",
-        "floor_number": 1
-    })
-    
-    cc.create_floor({
-        "name": "FLOOR_2",
-        "parent_name": "Global/United States/Golden Hills Campus/Sunset Tower",
-        "floor_number": 2
-    })
-    
-    cc.create_floor({
-        "name": "FLOOR_1",
-        "parent_name": "Global/United States/Lakefront Tower/Windy City Plaza",
-        "floor_number": 1
-    })
-    
-    cc.create_floor({
-        "name": "FLOOR_2",
-        "parent_name": "Global/United States/Lakefront Tower/Windy City Plaza",
-        "floor_number": 2
-    })
-    
-    cc.create_floor({
-        "name": "FLOOR_1",
-        "parent_name": "Global/United States/Oceanfront Mansion/Art Deco Mansion",
-        "floor_number": 1
-    })
-    
-    cc.create_floor({
-        "name": "FLOOR_1",
-        "parent_name": "Global/United States/Desert Oasis Branch/Desert Oasis Tower",
-        "floor_number": 1
-    })
+    cc._bulk(cc.create_floor, missing_sites([
+        {"name": "FLOOR_1", "parent_name": "Global/United States/Golden Hills Campus/Sunset Tower", "floor_number": 1},
+        {"name": "FLOOR_2", "parent_name": "Global/United States/Golden Hills Campus/Sunset Tower", "floor_number": 2},
+        {"name": "FLOOR_1", "parent_name": "Global/United States/Lakefront Tower/Windy City Plaza", "floor_number": 1},
+        {"name": "FLOOR_2", "parent_name": "Global/United States/Lakefront Tower/Windy City Plaza", "floor_number": 2},
+        {"name": "FLOOR_1", "parent_name": "Global/United States/Oceanfront Mansion/Art Deco Mansion", "floor_number": 1},
+        {"name": "FLOOR_1", "parent_name": "Global/United States/Desert Oasis Branch/Desert Oasis Tower", "floor_number": 1},
+    ]))
     
     # ==========================================================================
     # CREATE IP POOL RESERVATIONS
@@ -362,158 +552,46 @@ def main():
     print("\nCreating IP Pool Reservations...")
     
     # Get site IDs
-    sunset_tower_id = cc.get_site_id("Sunset Tower")
-    windy_city_id = cc.get_site_id("Windy City Plaza")
-    art_deco_id = cc.get_site_id("Art Deco Mansion")
-    desert_oasis_id = cc.get_site_id("Desert Oasis Tower")
-    
-    # Sunset Tower Reservations
-    cc.reserve_ip_pool(sunset_tower_id, {
-        "name": "ST_CORP",
-        "parent_pool": "US_CORP",
-        "prefix_length": 24,
-        "subnet": "10.201.2.0",
-        "dhcp_servers": ["10.201.0.1"],
-        "dns_servers": ["10.201.0.1"]
-    })
-    
-    cc.reserve_ip_pool(sunset_tower_id, {
-        "name": "ST_TECH",
-        "parent_pool": "US_TECH",
-        "prefix_length": 24,
-        "subnet": "10.202.2.0",
-        "dhcp_servers": ["10.202.0.1"],
-        "dns_servers": ["10.202.0.1"]
-    })
-    
-    cc.reserve_ip_pool(sunset_tower_id, {
-        "name": "ST_GUEST",
-        "parent_pool": "US_GUEST",
-        "prefix_length": 24,
-        "subnet": "10.203.2.0",
-        "dhcp_servers": ["10.203.0.1"],
-        "dns_servers": ["10.203.0.1"]
-    })
-    
-    cc.reserve_ip_pool(sunset_tower_id, {
-        "name": "ST_BYOD",
-        "parent_pool": "US_BYOD",
-        "prefix_length": 24,
-        "subnet": "10.204.2.0",
-        "dhcp_servers": ["10.204.0.1"],
-        "dns_servers": ["10.204.0.1"]
-    })
-    
-    # Windy City Plaza Reservations
-    cc.reserve_ip_pool(windy_city_id, {
-        "name": "WCP_CORP",
-        "parent_pool": "US_CORP",
-        "prefix_length": 24,
-        "subnet": "10.201.3.0",
-        "dhcp_servers": ["10.201.0.1"],
-        "dns_servers": ["10.201.0.1"]
-    })
-    
-    cc.reserve_ip_pool(windy_city_id, {
-        "name": "WCP_TECH",
-        "parent_pool": "US_TECH",
-        "prefix_length": 24,
-        "subnet": "10.202.3.0",
-        "dhcp_servers": ["10.202.0.1"],
-        "dns_servers": ["10.202.0.1"]
-    })
-    
-    cc.reserve_ip_pool(windy_city_id, {
-        "name": "WCP_GUEST",
-        "parent_pool": "US_GUEST",
-        "prefix_length": 24,
-        "subnet": "10.203.3.0",
-        "dhcp_servers": ["10.203.0.1"],
-        "dns_servers": ["10.203.0.1"]
-    })
-    
-    cc.reserve_ip_pool(windy_city_id, {
-        "name": "WCP_BYOD",
-        "parent_pool": "US_BYOD",
-        "prefix_length": 24,
-        "subnet": "10.204.3.0",
-        "dhcp_servers": ["10.204.0.1"],
-        "dns_servers": ["10.204.0.1"]
-    })
-    
-    # Art Deco Mansion Reservations
-    cc.reserve_ip_pool(art_deco_id, {
-        "name": "ADM_CORP",
-        "parent_pool": "US_CORP",
-        "prefix_length": 24,
-        "subnet": "10.201.4.0",
-        "dhcp_servers": ["10.201.0.1"],
-        "dns_servers": ["10.201.0.1"]
-    })
-    
-    cc.reserve_ip_pool(art_deco_id, {
-        "name": "ADM_TECH",
-        "parent_pool": "US_TECH",
-        "prefix_length": 24,
-        "subnet": "10.202.4.0",
-        "dhcp_servers": ["10.202.0.1"],
-        "dns_servers": ["10.202.0.1"]
-    })
-    
-    cc.reserve_ip_pool(art_deco_id, {
-        "name": "ADM_GUEST",
-        "parent_pool": "US_GUEST",
-        "prefix_length": 24,
-        "subnet": "10.203.4.0",
-        "dhcp_servers": ["10.203.0.1"],
-        "dns_servers": ["10.203.0.1"]
-    })
-    
-    cc.reserve_ip_pool(art_deco_id, {
-        "name": "ADM_BYOD",
-        "parent_pool": "US_BYOD",
-        "prefix_length": 24,
-        "subnet": "10.204.4.0",
-        "dhcp_servers": ["10.204.0.1"],
-        "dns_servers": ["10.204.0.1"]
-    })
-    
-    # Desert Oasis Tower Reservations
-    cc.reserve_ip_pool(desert_oasis_id, {
-        "name": "DOT_CORP",
-        "parent_pool": "US_CORP",
-        "prefix_length": 24,
-        "subnet": "10.201.1.0",
-        "dhcp_servers": ["10.201.0.1"],
-        "dns_servers": ["10.201.0.1"]
-    })
-    
-    cc.reserve_ip_pool(desert_oasis_id, {
-        "name": "DOT_TECH",
-        "parent_pool": "US_TECH",
-        "prefix_length": 24,
-        "subnet": "10.202.1.0",
-        "dhcp_servers": ["10.202.0.1"],
-        "dns_servers": ["10.202.0.1"]
-    })
-    
-    cc.reserve_ip_pool(desert_oasis_id, {
-        "name": "DOT_GUEST",
-        "parent_pool": "US_GUEST",
-        "prefix_length": 24,
-        "subnet": "10.203.1.0",
-        "dhcp_servers": ["10.203.0.1"],
-        "dns_servers": ["10.203.0.1"]
-    })
-    
-    cc.reserve_ip_pool(desert_oasis_id, {
-        "name": "DOT_BYOD",
-        "parent_pool": "US_BYOD",
-        "prefix_length": 24,
-        "subnet": "10.204.1.0",
-        "dhcp_servers": ["10.204.0.1"],
-        "dns_servers": ["10.204.0.1"]
-    })
+    site_ids = cc.prefetch_site_ids([
+        "Sunset Tower", "Windy City Plaza", "Art Deco Mansion", "Desert Oasis Tower"
+    ])
+    
+    # (name prefix, site ID, third octet) per building
+    sites = [
+        ("ST", site_ids["Sunset Tower"], 2),
+        ("WCP", site_ids["Windy City Plaza"], 3),
+        ("ADM", site_ids["Art Deco Mansion"], 4),
+        ("DOT", site_ids["Desert Oasis Tower"], 1),
+    ]
+    
+    # 4 pools x 4 buildings, subnet 10.<pool octet>.<site octet>.0/24
+    reservations = [
+        (site_id, {
+            "name": f"{prefix}_{suffix}",
+            "parent_pool": parent_pool,
+            "prefix_length": 24,
+            "subnet": f"10.{octet}.{site_octet}.0",
+            "gateway": f"10.{octet}.{site_octet}.1",
+            "dhcp_servers": [f"10.{octet}.0.1"],
+            "dns_servers": [f"10.{octet}.0.1"]
+        })
+        for prefix, site_id, site_octet in sites
+        for suffix, parent_pool, octet in POOLS
+    ]
+    
+    # One reservation listing per building, fetched in parallel
+    building_ids = [site_id for _, site_id, _ in sites]
+    existing_reservations = dict(zip(
+        building_ids, cc._executor.map(cc.list_reservation_names, building_ids)
+    ))
+    reservations = [
+        (site_id, reservation) for site_id, reservation in reservations
+        if reservation["name"] not in existing_reservations[site_id]
+    ]
+    
+    cc._bulk(lambda args, wait=True: cc.reserve_ip_pool(*args, wait=wait), reservations)
+    
+    cc.close()
     
     print("\n✅ All infrastructure created successfully!")
 
@@ -21,15 +21,149 @@ warnings.filterwarnings("ignore", category=DeprecationWarning)
 import requests
 import time
 import json
+import logging
 import sys
 import argparse
 import urllib3
 import yaml
 import os
+import socket
+import threading
+import copy
+import ipaddress
+from functools import lru_cache
 from pathlib import Path
+from typing import NamedTuple
+from concurrent.futures import ThreadPoolExecutor
+from requests.adapters import HTTPAdapter
+from urllib3.connection import HTTPConnection
+from urllib3.util.retry import Retry
 
-# Disable SSL warnings for demo
-urllib3.disable_warnings(urllib3.exceptions.InsecureRequestWarning)
+# orjson is a faster drop-in when installed; stdlib json otherwise
+try:
+    import orjson
+    _json_dumps = orjson.dumps
+    _json_loads = orjson.loads
+except ImportError:
+    def _json_dumps(obj) -> bytes:
+        return json.dumps(obj).encode()
+    _json_loads = json.loads
+
+# Optional: stream large listings instead of buffering the whole JSON body
+try:
+    import ijson
+except ImportError:
+    ijson = None
+
+# Optional: HTTP/2 client, used only when --http2 is given
+try:
+    import httpx
+except ImportError:
+    httpx = None
+
+# Transport errors from whichever HTTP client is in use
+_HTTP_ERRORS = (requests.exceptions.RequestException,) + ((httpx.HTTPError,) if httpx else ())
+
+# API client progress is logged (not printed) so embedding code can filter or silence it;
+# main() sends it to stdout, with per-poll task progress only at DEBUG (--verbose)
+log = logging.getLogger("catalyst")
+
+# Records logged on a thread that has set .records are collected there instead of written (see _map_buffered)
+_worker_output = threading.local()
+
+
+class _WorkerBufferFilter(logging.Filter):
+    """Divert a buffered worker's records into its list so they can be replayed in order"""
+    
+    def filter(self, record):
+        records = getattr(_worker_output, "records", None)
+        if records is None:
+            return True
+        records.append(record)
+        return False
+
+
+log.addFilter(_WorkerBufferFilter())
+
+# Prefer the libyaml C loader; same semantics as SafeLoader, several times faster
+try:
+    from yaml import CSafeLoader as _SafeLoader
+except ImportError:
+    from yaml import SafeLoader as _SafeLoader
+_yaml_fallback_warned = False
+
+# Parsed YAML files keyed by (device, inode): (mtime_ns, size), data
+_YAML_CACHE = {}
+
+
+def _load_yaml_cached(yaml_path):
+    """Parse a YAML file, reusing the last result while the file is unchanged
+
+    Raises FileNotFoundError if the file does not exist.
+    """
+    # A single stat both checks existence and identifies the file
+    st = yaml_path.stat()
+    signature = (st.st_mtime_ns, st.st_size)
+    key = (st.st_dev, st.st_ino)
+    cached = _YAML_CACHE.get(key)
+    if cached is None or cached[0] != signature:
+        global _yaml_fallback_warned
+        if _SafeLoader is yaml.SafeLoader and not _yaml_fallback_warned:
+            print("ℹ️  libyaml not available, using the slower pure-Python YAML loader")
+            print("   (reinstall PyYAML with libyaml support for faster config parsing)")
+            _yaml_fallback_warned = True
+        # Binary mode: the loader detects the encoding itself, no text-decode layer
+        with open(yaml_path, 'rb') as f:
+            cached = (signature, yaml.load(f, Loader=_SafeLoader))
+        _YAML_CACHE[key] = cached
+    # Hand out a copy so callers cannot modify the cached data
+    return copy.deepcopy(cached[1])
+
+
+# Floor attributes that are the same for every floor we create
+_FLOOR_DEFAULTS = {
+    "rfModel": "Cubes And Walled Offices",
+    "width": 100,
+    "length": 100,
+    "height": 10,
+}
+
+
+# Execution-status values that mean the task failed
+_FAILED_STATUSES = frozenset(('FAILURE', 'FAILED'))
+
+
+BAR = "=" * 70
+
+
+def banner(title, before="\n", after="\n"):
+    """Print a section title between two bars in a single write"""
+    print(f"{before}{BAR}\n{title}\n{BAR}{after}")
+
+
+def _error_snippet(response, limit=200):
+    """First bytes of an error body as text (skips requests' charset detection on .text)"""
+    return response.content[:limit].decode('utf-8', 'replace')
+
+
+@lru_cache(maxsize=None)
+def _first_host(subnet, prefix_length):
+    """Gateway address for a reservation: the first usable host of subnet/prefix_length"""
+    network = ipaddress.IPv4Network(f"{subnet}/{prefix_length}", strict=False)
+    return str(network.network_address + 1)
+
+
+def _wait_until(predicate, total=5.0, initial=0.25, factor=2):
+    """Call predicate with growing pauses until it returns something truthy or total seconds pass"""
+    deadline = time.monotonic() + total
+    delay = initial
+    while True:
+        result = predicate()
+        remaining = deadline - time.monotonic()
+        if result or remaining <= 0:
+            return result
+        time.sleep(min(delay, remaining))
+        delay *= factor
 
 
 def load_credentials_from_yaml(file_path='CC_Env.yml'):
@@ -50,44 +184,138 @@ def load_credentials_from_yaml(file_path='CC_Env.yml'):
     ]
     
     for yaml_path in yaml_paths:
-        if yaml_path.exists():
-            try:
-                with open(yaml_path, 'r') as f:
-                    config = yaml.safe_load(f)
-                    
-                    # Validate required fields
-                    required_fields = ['CC_IP', 'CC_USERNAME', 'CC_PASSWORD']
-                    missing = [f for f in required_fields if f not in config]
-                    if missing:
-                        print(f"❌ Missing required fields in {yaml_path}: {', '.join(missing)}")
-                        return None
-                    
-                    # Build configuration
-                    verify_ssl = not config.get('CC_INSECURE', True)
-                    
-                    return {
-                        'base_url': f"https://{config['CC_IP']}",
-                        'username': config['CC_USERNAME'],
-                        'password': config['CC_PASSWORD'],
-                        'verify_ssl': verify_ssl
-                    }
-            except yaml.YAMLError as e:
-                print(f"❌ Error parsing YAML file {yaml_path}: {e}")
-                return None
-            except Exception as e:
-                print(f"❌ Error reading credentials from {yaml_path}: {e}")
+        try:
+            config = _load_yaml_cached(yaml_path)
+            
+            # Validate required fields
+            required_fields = ['CC_IP', 'CC_USERNAME', 'CC_PASSWORD']
+            missing = [f for f in required_fields if f not in config]
+            if missing:
+                print(f"❌ Missing required fields in {yaml_path}: {', '.join(missing)}")
                 return None
+            
+            # Build configuration
+            verify_ssl = not config.get('CC_INSECURE', True)
+            
+            return {
+                'base_url': f"https://{config['CC_IP']}",
+                'username': config['CC_USERNAME'],
+                'password': config['CC_PASSWORD'],
+                'verify_ssl': verify_ssl
+            }
+        except FileNotFoundError:
+            continue  # Try the next location
+        except yaml.YAMLError as e:
+            print(f"❌ Error parsing YAML file {yaml_path}: {e}")
+            return None
+        except Exception as e:
+            print(f"❌ Error reading credentials from {yaml_path}: {e}")
+            return None
     
     return None
 
 
+class _KeepAliveAdapter(HTTPAdapter):
+    """HTTPAdapter whose sockets keep TCP_NODELAY (urllib3 default) and add SO_KEEPALIVE"""
+    
+    SOCKET_OPTIONS = HTTPConnection.default_socket_options + [
+        (socket.SOL_SOCKET, socket.SO_KEEPALIVE, 1),
+    ]
+    
+    def init_poolmanager(self, *args, **kwargs):
+        kwargs.setdefault("socket_options", self.SOCKET_OPTIONS)
+        super().init_poolmanager(*args, **kwargs)
+
+
 class CatalystCenterAPI:
-    def __init__(self, base_url: str, username: str, password: str):
+    # Task polling backoff: start at POLL_INTERVAL seconds, double up to MAX_POLL_INTERVAL
+    POLL_INTERVAL = 0.5
+    MAX_POLL_INTERVAL = 15
+    # Site/pool listings are reused for this many seconds (and dropped after creates/deletes)
+    LOOKUP_CACHE_TTL = 30
+    # Tokens are valid for 60 minutes; refresh a little before that
+    TOKEN_TTL_SEC = 55 * 60
+    
+    def __init__(self, base_url: str, username: str, password: str, verify_ssl: bool = False,
+                 http2: bool = False):
         self.base_url = base_url
+        # Endpoint URLs, built once instead of on every call
+        self._urls = {
+            "auth": f"{base_url}/dna/system/api/v1/auth/token",
+            "site": f"{base_url}/dna/intent/api/v1/site",
+            "site_id": f"{base_url}/dna/intent/api/v1/site/",
+            "pool": f"{base_url}/dna/intent/api/v1/global-pool",
+            "ippool": f"{base_url}/api/v2/ippool",
+            "ippool_id": f"{base_url}/api/v2/ippool/",
+            "reservations": f"{base_url}/dna/intent/api/v1/reserve-ip-subpool?siteId=",
+            "reserve": f"{base_url}/dna/intent/api/v1/reserve-ip-subpool/",
+            "task": f"{base_url}/api/v1/task/",
+            "execution_status": f"{base_url}/dna/intent/api/v1/dnacaap/management/execution-status/",
+        }
         self.username = username
         self.password = password
         self.token = None
+        self._token_acquired_at = 0.0
+        self._auth_lock = threading.Lock()
         self.headers = {"Content-Type": "application/json"}
+        self.http2 = http2
+        
+        if not verify_ssl:
+            # Disable SSL warnings for demo (self-signed lab certificates)
+            urllib3.disable_warnings(urllib3.exceptions.InsecureRequestWarning)
+        
+        if http2:
+            # Opt-in: one multiplexed HTTP/2 connection shared by every call and task poller.
+            # httpx.Client offers the same get/post/delete/headers/.content surface used here
+            if httpx is None:
+                raise ImportError("--http2 requires httpx with HTTP/2 support: pip install 'httpx[http2]'")
+            self.session = httpx.Client(
+                http2=True,
+                verify=verify_ssl,
+                timeout=30,
+                headers=self.headers,
+                auth=self._apply_token,
+                trust_env=False
+            )
+        else:
+            # Persistent session: keep-alive reuses the TCP+TLS connection across calls
+            self.session = requests.Session()
+            self.session.mount("https://", _KeepAliveAdapter(
+                pool_connections=4,
+                pool_maxsize=16,
+                # Transient errors on GETs only: 0.5s, 1s, 2s, 4s (capped at 8s) plus jitter.
+                # The final response is returned (not raised) so callers still see its status and body
+                max_retries=Retry(
+                    total=4,
+                    backoff_factor=0.5,
+                    backoff_max=8,
+                    backoff_jitter=0.25,
+                    status_forcelist=[429, 500, 502, 503, 504],
+                    allowed_methods=frozenset({"GET"}),
+                    raise_on_status=False
+                )
+            ))
+            # Verification is configured once on the session rather than per call
+            self.session.verify = verify_ssl
+            # No proxy/netrc/CA environment lookups on every request
+            self.session.trust_env = False
+            self.session.headers.update(self.headers)
+            # Every request checks the token age first (authenticate() overrides this with basic auth)
+            self.session.auth = self._apply_token
+            # Listings are repetitive JSON and compress well; requests decodes transparently
+            self.session.headers["Accept-Encoding"] = "gzip, deflate"
+            self.session.headers["Connection"] = "keep-alive"
+        
+        # (fetched_at, {name: [sites]}) and (fetched_at, {name: pool}); None = stale
+        self._site_cache = None
+        self._pool_cache = None
+        # {site_id: {groupName: reservation}}; a site's entry is dropped when its reservations change
+        self._reservation_cache = {}
+        # {siteNameHierarchy: site} for sites this run has created or found; entries go when the site is deleted
+        self._site_path_cache = {}
+        # Serialize cache fills (so concurrent workers share one GET) and the targeted edits made by deletes
+        self._site_cache_lock = threading.Lock()
+        self._pool_cache_lock = threading.Lock()
     
     def wait_for_task(self, task_id: str, task_url: str = None, timeout: int = 600) -> bool:
         """
@@ -103,166 +331,255 @@ class CatalystCenterAPI:
             url = f"{self.base_url}{task_url}" if not task_url.startswith('http') else task_url
         else:
             # Use the dnacaap execution-status endpoint (not the task endpoint)
-            url = f"{self.base_url}/dna/intent/api/v1/dnacaap/management/execution-status/{task_id}"
+            url = self._urls["execution_status"] + task_id
         
-        start_time = time.time()
-        check_interval = 10  # Check every 10 seconds
+        start_time = time.monotonic()
+        deadline = start_time + timeout
+        # Poll densely at first, then back off; errors back off on their own schedule
+        interval = self.POLL_INTERVAL
+        error_interval = self.POLL_INTERVAL
+        last_status = None
         
-        while time.time() - start_time < timeout:
+        while time.monotonic() < deadline:
             try:
-                response = requests.get(url, headers=self.headers, verify=False, timeout=30)
+                response = self.session.get(url, timeout=30)
                 
                 # Handle 404 - task might not exist yet or completed too quickly
                 if response.status_code == 404:
-                    print("  ℹ️  Task not found (may have completed quickly)")
+                    log.info("  ℹ️  Task not found (may have completed quickly)")
                     return True
                 
                 if response.status_code == 200:
-                    task_data = response.json()
+                    task_data = _json_loads(response.content)
                     
-                    # Check status field (dnacaap execution-status format)
+                    # Read the fields once; status (execution-status format) decides most polls
                     status = task_data.get('status', '')
+                    bapi_error = task_data.get('bapiError')
+                    is_error = task_data.get('isError')
+                    end_time = task_data.get('endTime') or task_data.get('endTimeEpoch')
                     
                     if status == 'SUCCESS':
                         # Additional validation: Check bapiSyncResponse for actual errors
                         # Some APIs report SUCCESS but include error details in bapiSyncResponse
-                        bapi_error = task_data.get('bapiError')
                         if bapi_error:
-                            print(f"  ❌ Task reported success but has error: {bapi_error}")
+                            log.error("  ❌ Task reported success but has error: %s", bapi_error)
                             return False
                         
                         # Check bapiSyncResponseJson for status indicators
-                        sync_response = task_data.get('bapiSyncResponseJson', {})
-                        if isinstance(sync_response, dict):
-                            # Some responses have status: "false" even with SUCCESS
-                            if sync_response.get('status') == 'false' or sync_response.get('status') == False:
-                                error_msg = sync_response.get('message', 'Unknown error')
-                                print(f"  ❌ Task failed (bapiSyncResponse): {error_msg}")
-                                return False
+                        sync_response = task_data.get('bapiSyncResponseJson')
+                        # Some responses have status: "false" even with SUCCESS
+                        if isinstance(sync_response, dict) and sync_response.get('status') in ('false', False):
+                            error_msg = sync_response.get('message', 'Unknown error')
+                            log.error("  ❌ Task failed (bapiSyncResponse): %s", error_msg)
+                            return False
                         
                         return True
-                    elif status in ['FAILURE', 'FAILED']:
-                        error = task_data.get('bapiError', 'Task failed')
-                        print(f"  ❌ Task failed: {error}")
+                    elif status in _FAILED_STATUSES:
+                        log.error("  ❌ Task failed: %s", bapi_error or 'Task failed')
                         return False
-                    
-                    # Also check older task response format
-                    if task_data.get('isError'):
+                    elif is_error:
+                        # Older task response format
                         error_msg = task_data.get('failureReason', 'Unknown error')
-                        print(f"  ❌ Task failed: {error_msg}")
+                        log.error("  ❌ Task failed: %s", error_msg)
                         return False
+                    elif end_time:
+                        # Task ended without reporting an error
+                        return True
                     
-                    # Check if task has ended
-                    if task_data.get('endTime') or task_data.get('endTimeEpoch'):
-                        # Task ended - verify it was successful
-                        if status == 'SUCCESS' or not task_data.get('isError'):
-                            return True
-                        else:
-                            print(f"  ❌ Task ended with error")
-                            return False
-                    
-                    # Task still in progress
-                    elapsed = int(time.time() - start_time)
-                    print(f"  ⏳ Task in progress... ({elapsed}s elapsed, status: {status})")
-                    time.sleep(check_interval)
+                    # Task still in progress - restart the backoff when the status moves
+                    if status != last_status:
+                        last_status = status
+                        interval = self.POLL_INTERVAL
+                    # Per-poll progress only shows at DEBUG (--verbose)
+                    log.debug("  ⏳ Task in progress... (%ds elapsed, status: %s)",
+                              time.monotonic() - start_time, status)
+                    time.sleep(interval)
+                    interval = min(interval * 2, self.MAX_POLL_INTERVAL)
                     
                 else:
                     # Unexpected status code
-                    print(f"  ⚠️  Unexpected status {response.status_code}, retrying...")
-                    time.sleep(check_interval)
+                    log.warning("  ⚠️  Unexpected status %s, retrying...", response.status_code)
+                    time.sleep(error_interval)
+                    error_interval = min(error_interval * 2, self.MAX_POLL_INTERVAL)
                     
             except requests.exceptions.Timeout:
-                print(f"  ⚠️  Request timeout, retrying...")
-                time.sleep(check_interval)
+                log.warning("  ⚠️  Request timeout, retrying...")
+                time.sleep(error_interval)
+                error_interval = min(error_interval * 2, self.MAX_POLL_INTERVAL)
             except requests.exceptions.ConnectionError:
-                print(f"  ⚠️  Connection error, retrying...")
-                time.sleep(check_interval)
+                log.warning("  ⚠️  Connection error, retrying...")
+                time.sleep(error_interval)
+                error_interval = min(error_interval * 2, self.MAX_POLL_INTERVAL)
             except Exception as e:
-                print(f"  ⚠️  Error: {str(e)[:50]}, retrying...")
-                time.sleep(check_interval)
+                log.warning("  ⚠️  Error: %.50s, retrying...", e)
+                time.sleep(error_interval)
+                error_interval = min(error_interval * 2, self.MAX_POLL_INTERVAL)
         
         # Timeout reached
-        print(f"  ⏱️  Task monitoring timeout after {timeout}s")
-        print(f"  ℹ️  Assuming task completed (may need manual verification)")
+        log.warning("  ⏱️  Task monitoring timeout after %ss", timeout)
+        log.info("  ℹ️  Assuming task completed (may need manual verification)")
         return True  # Return True to allow process to continue
     
     def authenticate(self):
         """Get authentication token"""
-        auth_url = f"{self.base_url}/dna/system/api/v1/auth/token"
-        response = requests.post(
+        auth_url = self._urls["auth"]
+        response = self.session.post(
             auth_url,
             auth=(self.username, self.password),
-            verify=False,
             timeout=30
         )
         response.raise_for_status()
-        self.token = response.json()["Token"]
+        self.token = _json_loads(response.content)["Token"]
         self.headers["X-Auth-Token"] = self.token
-        print("✅ Authentication successful")
+        self.session.headers["X-Auth-Token"] = self.token
+        self._token_acquired_at = time.monotonic()
+        log.info("✅ Authentication successful")
         return self.token
     
+    def _ensure_token(self):
+        """Re-authenticate when the token is near expiry; concurrent callers share one refresh"""
+        if not self.token or time.monotonic() - self._token_acquired_at < self.TOKEN_TTL_SEC:
+            return
+        with self._auth_lock:
+            # Another thread may have refreshed while this one waited for the lock
+            if time.monotonic() - self._token_acquired_at >= self.TOKEN_TTL_SEC:
+                log.info("🔐 Token about to expire, re-authenticating...")
+                self.authenticate()
+    
+    def _refresh_token(self, stale_token: str):
+        """Re-authenticate once, even when several threads hit the same rejected token"""
+        with self._auth_lock:
+            # Skip if another thread already replaced the token while this one waited
+            if self.token == stale_token:
+                self.authenticate()
+    
+    def _apply_token(self, request):
+        """Session auth hook (requests and httpx): refresh if needed, then attach the current token"""
+        self._ensure_token()
+        if self.token:
+            request.headers["X-Auth-Token"] = self.token
+        return request
+    
+    def _get_json(self, url: str):
+        """GET a URL and return its decoded JSON body (raises on HTTP errors)"""
+        response = self.session.get(url, timeout=30)
+        response.raise_for_status()
+        return _json_loads(response.content)
+    
+    def _post_json(self, url: str, payload: dict):
+        """POST a payload serialized with the fast JSON encoder and return the response"""
+        if self.http2:
+            # httpx takes raw bytes as content= (data= is for form fields)
+            return self.session.post(url, content=_json_dumps(payload), timeout=30)
+        return self.session.post(url, data=_json_dumps(payload), timeout=30)
+    
+    def _iter_response_items(self, url):
+        """Yield the items of a {"response": [...]} listing, streamed with ijson when available"""
+        if ijson is None or self.http2:
+            yield from self._get_json(url)["response"]
+            return
+        with self.session.get(url, timeout=30, stream=True) as response:
+            response.raise_for_status()
+            # Let urllib3 undo the gzip/deflate encoding before ijson sees the bytes
+            response.raw.decode_content = True
+            yield from ijson.items(response.raw, "response.item", use_float=True)
+    
+    def _cache_is_stale(self, cache) -> bool:
+        """True when a (fetched_at, index) lookup cache is empty or older than LOOKUP_CACHE_TTL"""
+        return cache is None or time.monotonic() - cache[0] > self.LOOKUP_CACHE_TTL
+    
+    def _fetch_sites(self, refresh: bool = False):
+        """Get all sites indexed by name ({name: [sites]}), cached for LOOKUP_CACHE_TTL seconds"""
+        cache = self._site_cache
+        if refresh or self._cache_is_stale(cache):
+            with self._site_cache_lock:
+                # Concurrent workers that found the cache cold share the first one's fetch
+                cache = self._site_cache
+                if refresh or self._cache_is_stale(cache):
+                    fetched_at = time.monotonic()
+                    sites_by_name = {}
+                    for site in self._iter_response_items(self._urls["site"]):
+                        sites_by_name.setdefault(site["name"], []).append(site)
+                    cache = self._site_cache = (fetched_at, sites_by_name)
+        return cache[1]
+    
+    def _fetch_pools(self, refresh: bool = False):
+        """Get all global pools indexed by name, cached for LOOKUP_CACHE_TTL seconds"""
+        cache = self._pool_cache
+        if refresh or self._cache_is_stale(cache):
+            with self._pool_cache_lock:
+                # Concurrent workers that found the cache cold share the first one's fetch
+                cache = self._pool_cache
+                if refresh or self._cache_is_stale(cache):
+                    fetched_at = time.monotonic()
+                    pools_by_name = {}
+                    for pool in self._iter_response_items(self._urls["pool"]):
+                        pools_by_name.setdefault(pool.get("ipPoolName"), pool)
+                    cache = self._pool_cache = (fetched_at, pools_by_name)
+        return cache[1]
+    
+    def _forget_site(self, site_id: str):
+        """Drop a deleted site from the lookup caches, keeping every other entry warm"""
+        with self._site_cache_lock:
+            if self._site_cache is not None:
+                fetched_at, sites_by_name = self._site_cache
+                pruned = {}
+                for name, sites in sites_by_name.items():
+                    kept = [site for site in sites if site["id"] != site_id]
+                    if kept:
+                        pruned[name] = kept
+                self._site_cache = (fetched_at, pruned)
+            self._site_path_cache = {
+                path: site for path, site in self._site_path_cache.items() if site["id"] != site_id
+            }
+            self._reservation_cache.pop(site_id, None)
+    
     def get_site_by_name(self, site_name: str):
         """Get site by name (returns first match only)"""
-        url = f"{self.base_url}/dna/intent/api/v1/site"
-        response = requests.get(url, headers=self.headers, verify=False, timeout=30)
-        sites = response.json()["response"]
-        for site in sites:
-            if site["name"] == site_name:
-                return site
-        return None
-    
-    def get_site_by_name_and_parent(self, site_name: str, parent_name: str):
-        """Get site by name under a specific parent (for duplicate names like floors)"""
-        url = f"{self.base_url}/dna/intent/api/v1/site"
-        response = requests.get(url, headers=self.headers, verify=False, timeout=30)
-        sites = response.json()["response"]
-        
-        for site in sites:
-            if site["name"] == site_name:
-                # Check if this site is under the specified parent
-                hierarchy = site.get('siteNameHierarchy', '')
-                # Hierarchy format: "Global/United States/Area/Building/Floor"
-                parts = hierarchy.split('/')
-                
-                # Check if parent_name is the direct parent (second to last in path)
-                if len(parts) >= 2 and parts[-2] == parent_name:
-                    return site
-        
-        return None
+        return self._fetch_sites().get(site_name, [None])[0]
+    
+    def get_site_by_path(self, path: str, refresh: bool = False):
+        """Get site by full hierarchy path (e.g. "Global/United States/Area/Building"), remembered once found"""
+        site = self._site_path_cache.get(path)
+        if site is None:
+            name = path.rsplit('/', 1)[-1]
+            for candidate in self._fetch_sites(refresh).get(name, []):
+                if candidate.get('siteNameHierarchy') == path:
+                    site = self._site_path_cache[path] = candidate
+                    break
+        return site
+    
+    def get_sites_under(self, *parent_hierarchies: str):
+        """Get every site below any of the hierarchy paths (e.g. all floors of some buildings), from one fresh listing"""
+        prefixes = tuple(parent + "/" for parent in parent_hierarchies)
+        return [
+            site
+            for sites in self._fetch_sites(refresh=True).values()
+            for site in sites
+            if site.get('siteNameHierarchy', '').startswith(prefixes)
+        ]
     
     def get_global_pool_by_name(self, pool_name: str):
         """Get global pool by name"""
-        url = f"{self.base_url}/dna/intent/api/v1/global-pool"
-        response = requests.get(url, headers=self.headers, verify=False, timeout=30)
-        pools = response.json()["response"]
-        for pool in pools:
-            if pool.get("ipPoolName") == pool_name:
-                return pool
-        return None
-    
-    def get_reservation_by_name(self, site_name: str, reservation_name: str):
-        """Get IP pool reservation by name for a specific site"""
-        # Get site ID
-        site = self.get_site_by_name(site_name)
-        if not site:
-            return None
-        
-        site_id = site["id"]
-        
+        return self._fetch_pools().get(pool_name)
+    
+    def _fetch_reservations(self, site_id: str):
+        """Get a site's IP pool reservations indexed by name, fetched once per site"""
+        reservations = self._reservation_cache.get(site_id)
+        if reservations is None:
+            url = self._urls["reservations"] + site_id
+            reservations = {}
+            for res in self._get_json(url).get('response', []):
+                reservations.setdefault(res.get('groupName'), res)
+            self._reservation_cache[site_id] = reservations
+        return reservations
+    
+    def _get_reservation_for_site(self, site: dict, reservation_name: str):
+        """Get IP pool reservation by name for an already looked-up site"""
         try:
-            url = f"{self.base_url}/dna/intent/api/v1/reserve-ip-subpool?siteId={site_id}"
-            response = requests.get(url, headers=self.headers, verify=False, timeout=30)
-            
-            if response.status_code == 200:
-                reservations = response.json().get('response', [])
-                
-                for res in reservations:
-                    if res.get('groupName') == reservation_name:
-                        return res
+            return self._fetch_reservations(site["id"]).get(reservation_name)
         except Exception:
-            pass
-        
-        return None
+            return None
     
     def wait_for_task_v2(self, task_id: str, timeout: int = 120) -> bool:
         """
@@ -272,38 +589,40 @@ class CatalystCenterAPI:
             task_id: The task ID from /api/v2/ippool response
             timeout: Maximum seconds to wait
         """
-        url = f"{self.base_url}/api/v1/task/{task_id}"
-        start_time = time.time()
+        url = self._urls["task"] + task_id
+        start_time = time.monotonic()
+        deadline = start_time + timeout
         check_interval = 3
         
-        while time.time() - start_time < timeout:
+        while time.monotonic() < deadline:
             try:
-                response = requests.get(url, headers=self.headers, verify=False, timeout=30)
+                response = self.session.get(url, timeout=30)
                 
                 if response.status_code == 200:
-                    task_data = response.json().get('response', {})
+                    task_data = _json_loads(response.content).get('response', {})
                     
                     # Check if task is complete (has endTime)
                     if task_data.get('endTime'):
                         if task_data.get('isError'):
                             error_msg = task_data.get('failureReason', 'Unknown error')
-                            print(f"  ❌ Task failed: {error_msg}")
+                            log.error("  ❌ Task failed: %s", error_msg)
                             return False
                         return True
                     
                     # Task still in progress
-                    elapsed = int(time.time() - start_time)
-                    print(f"  ⏳ Task in progress... ({elapsed}s elapsed)")
+                    if log.isEnabledFor(logging.DEBUG):
+                        elapsed = int(time.monotonic() - start_time)
+                        log.debug("  ⏳ Task in progress... (%ds elapsed)", elapsed)
                     time.sleep(check_interval)
                 else:
-                    print(f"  ⚠️  Unexpected status {response.status_code}, retrying...")
+                    log.warning("  ⚠️  Unexpected status %s, retrying...", response.status_code)
                     time.sleep(check_interval)
                     
             except Exception as e:
-                print(f"  ⚠️  Error: {str(e)[:50]}, retrying...")
+                log.warning("  ⚠️  Error: %.50s, retrying...", e)
                 time.sleep(check_interval)
         
-        print(f"  ⏱️  Task monitoring timeout after {timeout}s")
+        log.warning("  ⏱️  Task monitoring timeout after %ss", timeout)
         return True  # Assume success on timeout
     
     def create_ip_pool(self, name: str, cidr: str):
@@ -311,47 +630,45 @@ class CatalystCenterAPI:
         # Check if exists
         existing = self.get_global_pool_by_name(name)
         if existing:
-            print(f"ℹ️  Pool '{name}' already exists, skipping")
+            log.info("ℹ️  Pool '%s' already exists, skipping", name)
             return existing
         
         # Use /api/v2/ippool endpoint which actually creates pools
-        url = f"{self.base_url}/api/v2/ippool"
+        url = self._urls["ippool"]
         payload = {
             "ipPoolName": name,
             "ipPoolCidr": cidr,
             "type": "Generic"
         }
         
-        print(f"Creating pool '{name}' ({cidr})...")
-        response = requests.post(url, headers=self.headers, json=payload, verify=False, timeout=30)
+        log.info("Creating pool '%s' (%s)...", name, cidr)
+        response = self._post_json(url, payload)
         response.raise_for_status()
         
-        result = response.json()
+        result = _json_loads(response.content)
         
         # Get task ID from response (format: {"response": {"taskId": "...", "url": "..."}})
         task_id = result.get('response', {}).get('taskId')
         
         if task_id:
-            print(f"  Waiting for task {task_id[:8]}...")
+            log.info("  Waiting for task %.8s...", task_id)
             if self.wait_for_task_v2(task_id, timeout=120):
-                # Wait briefly for pool to propagate
-                time.sleep(2)
-                
-                # Verify the pool actually exists
-                created_pool = self.get_global_pool_by_name(name)
+                # Verify the pool actually exists, re-reading the pool list while it propagates
+                created_pool = _wait_until(lambda: self._fetch_pools(refresh=True).get(name))
                 if created_pool:
-                    print(f"✅ Pool '{name}' created successfully")
+                    log.info("✅ Pool '%s' created successfully", name)
                     return created_pool
                 else:
-                    print(f"⚠️  Task completed but pool '{name}' not immediately visible")
-                    print(f"  Pool may still be propagating...")
+                    log.warning("⚠️  Task completed but pool '%s' not immediately visible", name)
+                    log.info("  Pool may still be propagating...")
                     return result
             else:
-                print(f"❌ Pool '{name}' creation failed")
+                log.error("❌ Pool '%s' creation failed", name)
                 return None
         else:
-            print(f"✅ Pool '{name}' created")
+            log.info("✅ Pool '%s' created", name)
         
+        self._pool_cache = None
         return result
     
     def create_area(self, name: str, parent_name: str):
@@ -359,10 +676,10 @@ class CatalystCenterAPI:
         # Check if exists
         existing = self.get_site_by_name(name)
         if existing:
-            print(f"ℹ️  Area '{name}' already exists, skipping")
+            log.info("ℹ️  Area '%s' already exists, skipping", name)
             return existing
         
-        url = f"{self.base_url}/dna/intent/api/v1/site"
+        url = self._urls["site"]
         payload = {
             "type": "area",
             "site": {
@@ -373,36 +690,38 @@ class CatalystCenterAPI:
             }
         }
         
-        print(f"Creating area '{name}'...")
-        response = requests.post(url, headers=self.headers, json=payload, verify=False, timeout=30)
+        log.info("Creating area '%s'...", name)
+        response = self._post_json(url, payload)
         response.raise_for_status()
         
-        result = response.json()
+        result = _json_loads(response.content)
         task_id = result.get('executionId')
         task_url = result.get('executionStatusUrl')
         
         if task_id:
-            print(f"  Waiting for task {task_id[:8]}...")
+            log.info("  Waiting for task %.8s...", task_id)
             if self.wait_for_task(task_id, task_url):
-                print(f"✅ Area '{name}' created successfully")
+                log.info("✅ Area '%s' created successfully", name)
             else:
-                print(f"❌ Area '{name}' creation failed")
+                log.error("❌ Area '%s' creation failed", name)
                 return None
         else:
-            print(f"✅ Area '{name}' created")
+            log.info("✅ Area '%s' created", name)
         
+        self._site_cache = None
         time.sleep(1)
         return result
     
     def create_building(self, name: str, parent_name: str, latitude: float, longitude: float, address: str, country: str):
         """Create building"""
+        path = f"{parent_name}/{name}"
         # Check if exists
-        existing = self.get_site_by_name(name)
+        existing = self.get_site_by_path(path)
         if existing:
-            print(f"ℹ️  Building '{name}' already exists, skipping")
+            log.info("ℹ️  Building '%s' already exists, skipping", name)
             return existing
         
-        url = f"{self.base_url}/dna/intent/api/v1/site"
+        url = self._urls["site"]
         payload = {
             "type": "building",
             "site": {
@@ -417,104 +736,104 @@ class CatalystCenterAPI:
             }
         }
         
-        print(f"Creating building '{name}'...")
-        response = requests.post(url, headers=self.headers, json=payload, verify=False, timeout=30)
+        log.info("Creating building '%s'...", name)
+        response = self._post_json(url, payload)
         response.raise_for_status()
         
-        result = response.json()
+        result = _json_loads(response.content)
         task_id = result.get('executionId')
         task_url = result.get('executionStatusUrl')
         
         if task_id:
-            print(f"  Waiting for task {task_id[:8]}...")
+            log.info("  Waiting for task %.8s...", task_id)
             if self.wait_for_task(task_id, task_url):
-                print(f"✅ Building '{name}' created successfully")
+                log.info("✅ Building '%s' created successfully", name)
             else:
-                print(f"❌ Building '{name}' creation failed")
+                log.error("❌ Building '%s' creation failed", name)
                 return None
         else:
-            print(f"✅ Building '{name}' created")
+            log.info("✅ Building '%s' created", name)
         
-        time.sleep(2)  # Buildings take longer
+        # Buildings take longer; wait until it is listed so floors can be created under it
+        _wait_until(lambda: self.get_site_by_path(path, refresh=True))
         return result
     
     def create_floor(self, name: str, parent_name: str, floor_number: int):
         """Create floor"""
         # Check if floor already exists under this specific parent
-        # Use parent-aware lookup since floors can have duplicate names
-        existing_floor = self.get_site_by_name_and_parent(name, parent_name)
+        # Look up by full path since floor names repeat across buildings
+        existing_floor = self.get_site_by_path(f"{parent_name}/{name}")
         if existing_floor:
-            print(f"ℹ️  Floor '{name}' already exists at '{parent_name}', skipping")
+            log.info("ℹ️  Floor '%s' already exists at '%s', skipping", name, parent_name)
             return existing_floor
         
-        url = f"{self.base_url}/dna/intent/api/v1/site"
+        url = self._urls["site"]
         payload = {
             "type": "floor",
             "site": {
                 "floor": {
                     "name": name,
                     "parentName": parent_name,
-                    "rfModel": "Cubes And Walled Offices",
-                    "width": 100,
-                    "length": 100,
-                    "height": 10,
+                    **_FLOOR_DEFAULTS,
                     "floorNumber": floor_number
                 }
             }
         }
         
-        print(f"Creating floor '{name}' at '{parent_name}'...")
-        response = requests.post(url, headers=self.headers, json=payload, verify=False, timeout=30)
+        log.info("Creating floor '%s' at '%s'...", name, parent_name)
+        response = self._post_json(url, payload)
         
         # Check for errors before proceeding
         if response.status_code != 202:
-            error_msg = response.text[:200] if response.text else "Unknown error"
-            print(f"❌ Floor creation request failed (status {response.status_code}): {error_msg}")
+            error_msg = _error_snippet(response) or "Unknown error"
+            log.error("❌ Floor creation request failed (status %s): %s", response.status_code, error_msg)
             return None
         
-        result = response.json()
+        result = _json_loads(response.content)
         task_id = result.get('executionId')
         task_url = result.get('executionStatusUrl')
         
         if task_id:
-            print(f"  Waiting for task {task_id[:8]}...")
+            log.info("  Waiting for task %.8s...", task_id)
             if self.wait_for_task(task_id, task_url):
-                print(f"✅ Floor '{name}' created successfully")
+                log.info("✅ Floor '%s' created successfully", name)
             else:
-                print(f"❌ Floor '{name}' creation failed")
+                log.error("❌ Floor '%s' creation failed", name)
                 return None
         else:
-            print(f"✅ Floor '{name}' created")
+            log.info("✅ Floor '%s' created", name)
         
+        self._site_cache = None
         time.sleep(1)
         return result
     
-    def reserve_ip_subpool(self, site_name: str, reservation_name: str, parent_pool: str, subnet: str, prefix_length: int):
-        """Reserve IP subpool for a site"""
-        # Check if reservation already exists
-        existing = self.get_reservation_by_name(site_name, reservation_name)
-        if existing:
-            print(f"ℹ️  Reservation '{reservation_name}' already exists at '{site_name}', skipping")
-            return existing
-        
+    def reserve_ip_subpool(self, site_name: str, reservation_name: str, parent_pool: str, subnet: str, prefix_length: int,
+                           site_path: str = None):
+        """Reserve IP subpool for a site (site_path, when known, skips the lookup by name)"""
         # Get site ID
-        site = self.get_site_by_name(site_name)
+        site = self.get_site_by_path(site_path) if site_path else self.get_site_by_name(site_name)
         if not site:
-            print(f"❌ Site '{site_name}' not found")
+            log.error("❌ Site '%s' not found", site_name)
             return None
         
+        # Check if reservation already exists
+        existing = self._get_reservation_for_site(site, reservation_name)
+        if existing:
+            log.info("ℹ️  Reservation '%s' already exists at '%s', skipping", reservation_name, site_name)
+            return existing
+        
         site_id = site["id"]
-        gateway = f"{subnet.rsplit('.', 1)[0]}.1"
+        gateway = _first_host(subnet, prefix_length)
         
         # Get parent pool to find its CIDR
         parent_pool_obj = self.get_global_pool_by_name(parent_pool)
         if not parent_pool_obj:
-            print(f"❌ Global pool '{parent_pool}' not found")
+            log.error("❌ Global pool '%s' not found", parent_pool)
             return None
         
         parent_cidr = parent_pool_obj.get("ipPoolCidr")
         
-        url = f"{self.base_url}/dna/intent/api/v1/reserve-ip-subpool/{site_id}"
+        url = self._urls["reserve"] + site_id
         payload = {
             "name": reservation_name,
             "type": "Generic",
@@ -525,39 +844,40 @@ class CatalystCenterAPI:
             "ipv4GateWay": gateway
         }
         
-        print(f"Reserving '{reservation_name}' ({subnet}/{prefix_length}) from '{parent_pool}' ({parent_cidr})...")
-        response = requests.post(url, headers=self.headers, json=payload, verify=False, timeout=30)
+        log.info("Reserving '%s' (%s/%s) from '%s' (%s)...", reservation_name, subnet, prefix_length, parent_pool, parent_cidr)
+        response = self._post_json(url, payload)
         response.raise_for_status()
         
-        result = response.json()
+        result = _json_loads(response.content)
         
         # Get task ID from response
         task_id = result.get('executionId')
         task_url = result.get('executionStatusUrl')
         
         if task_id:
-            print(f"  Waiting for task {task_id[:8]}...")
+            log.info("  Waiting for task %.8s...", task_id)
             if self.wait_for_task(task_id, task_url, timeout=600):
-                print(f"✅ Reservation '{reservation_name}' created successfully")
+                log.info("✅ Reservation '%s' created successfully", reservation_name)
             else:
-                print(f"❌ Reservation '{reservation_name}' creation failed")
+                log.error("❌ Reservation '%s' creation failed", reservation_name)
                 return None
         elif task_url:
             # Fallback: check executionStatusUrl once (older API style)
             time.sleep(2)
             status_url = f"{self.base_url}{task_url}"
-            status_resp = requests.get(status_url, headers=self.headers, verify=False, timeout=30)
-            status = status_resp.json()
+            status_resp = self.session.get(status_url, timeout=30)
+            status = _json_loads(status_resp.content)
             
             if status.get("status") == "SUCCESS":
-                print(f"✅ Reservation '{reservation_name}' created")
+                log.info("✅ Reservation '%s' created", reservation_name)
             else:
                 error = status.get("bapiError", "Unknown error")
-                print(f"❌ Reservation failed: {error}")
+                log.error("❌ Reservation failed: %s", error)
                 return None
         else:
-            print(f"✅ Reservation '{reservation_name}' created")
+            log.info("✅ Reservation '%s' created", reservation_name)
         
+        self._reservation_cache.pop(site_id, None)
         time.sleep(1)
         return result
     
@@ -569,55 +889,61 @@ class CatalystCenterAPI:
         """Delete a site (area/building/floor) with retry on auth failure"""
         site = self.get_site_by_name(site_name)
         if not site:
-            print(f"ℹ️  Site '{site_name}' not found, skipping")
+            log.info("ℹ️  Site '%s' not found, skipping", site_name)
             return None
         
-        site_id = site["id"]
-        url = f"{self.base_url}/dna/intent/api/v1/site/{site_id}"
+        return self.delete_site_by_id(site["id"], site_name)
+    
+    def delete_site_by_id(self, site_id: str, site_name: str):
+        """Delete a site by ID (site_name is only used in messages) with retry on auth failure"""
+        url = self._urls["site_id"] + site_id
         
-        print(f"Deleting site '{site_name}'...")
+        log.info("Deleting site '%s'...", site_name)
         
         # Try deletion with retry on 401
         max_retries = 2
         for attempt in range(max_retries):
+            # Token this attempt is sent with; concurrent deletes that fail on it share one refresh
+            token = self.token
             try:
-                response = requests.delete(url, headers=self.headers, verify=False, timeout=30)
+                response = self.session.delete(url, timeout=30)
                 
                 # If 401, re-authenticate and retry
                 if response.status_code == 401 and attempt < max_retries - 1:
-                    print(f"  🔐 Token expired, re-authenticating...")
-                    self.authenticate()
+                    log.info("  🔐 Token expired, re-authenticating...")
+                    self._refresh_token(token)
                     continue
                 
                 # Check for other errors
                 if response.status_code != 202 and response.status_code != 200:
-                    error_msg = response.text
-                    print(f"  ❌ Delete failed (status {response.status_code}): {error_msg[:200]}")
+                    error_msg = _error_snippet(response)
+                    log.error("  ❌ Delete failed (status %s): %s", response.status_code, error_msg)
                     return None
                 
                 # Get task info from response
-                result = response.json() if response.text else {}
+                result = _json_loads(response.content) if response.content else {}
                 task_id = result.get('executionId')
                 task_url = result.get('executionStatusUrl')
                 
                 if task_id:
-                    print(f"  Waiting for deletion task {task_id[:8]}...")
+                    log.info("  Waiting for deletion task %.8s...", task_id)
                     if self.wait_for_task(task_id, task_url):
-                        print(f"✅ Site '{site_name}' deleted successfully")
+                        log.info("✅ Site '%s' deleted successfully", site_name)
                     else:
-                        print(f"❌ Site '{site_name}' deletion failed")
+                        log.error("❌ Site '%s' deletion failed", site_name)
                         return None
                 else:
-                    print(f"✅ Site '{site_name}' deleted")
+                    log.info("✅ Site '%s' deleted", site_name)
                 
+                self._forget_site(site_id)
                 time.sleep(0.5)
                 return result
-            except requests.exceptions.RequestException as e:
+            except _HTTP_ERRORS as e:
                 if attempt < max_retries - 1:
-                    print(f"  ⚠️  Retrying after error: {str(e)[:100]}")
-                    self.authenticate()
+                    log.warning("  ⚠️  Retrying after error: %.100s", e)
+                    self._refresh_token(token)
                 else:
-                    print(f"  ❌ Failed to delete '{site_name}': {str(e)[:100]}")
+                    log.error("  ❌ Failed to delete '%s': %.100s", site_name, e)
                     return None
         
         return None
@@ -627,218 +953,276 @@ class CatalystCenterAPI:
         # Get site ID
         site = self.get_site_by_name(site_name)
         if not site:
-            print(f"ℹ️  Site '{site_name}' not found for reservation '{reservation_name}'")
+            log.info("ℹ️  Site '%s' not found for reservation '%s'", site_name, reservation_name)
             return None
         
         site_id = site["id"]
         
-        # Get reservations for this site
+        # Find the reservation by name among this site's reservations
         try:
-            url = f"{self.base_url}/dna/intent/api/v1/reserve-ip-subpool?siteId={site_id}"
-            response = requests.get(url, headers=self.headers, verify=False, timeout=30)
+            reservation = self._fetch_reservations(site_id).get(reservation_name)
+            reservation_id = reservation.get('id') if reservation else None
             
-            if response.status_code == 200:
-                reservations = response.json().get('response', [])
-                
-                # Find the reservation by name
-                reservation_id = None
-                for res in reservations:
-                    if res.get('groupName') == reservation_name:
-                        reservation_id = res.get('id')
-                        break
-                
-                if not reservation_id:
-                    print(f"ℹ️  Reservation '{reservation_name}' not found in '{site_name}'")
-                    return None
-                
-                # Delete the reservation
-                delete_url = f"{self.base_url}/dna/intent/api/v1/reserve-ip-subpool/{reservation_id}"
-                print(f"Deleting reservation '{reservation_name}' from '{site_name}'...")
-                
-                del_response = requests.delete(delete_url, headers=self.headers, verify=False, timeout=30)
+            if not reservation_id:
+                log.info("ℹ️  Reservation '%s' not found in '%s'", reservation_name, site_name)
+                return None
+            
+            # Delete the reservation
+            delete_url = self._urls["reserve"] + reservation_id
+            log.info("Deleting reservation '%s' from '%s'...", reservation_name, site_name)
+            
+            del_response = self.session.delete(delete_url, timeout=30)
+            
+            if del_response.status_code in [200, 202]:
+                # Get task info from response
+                result = _json_loads(del_response.content) if del_response.content else {}
+                task_id = result.get('executionId')
+                task_url = result.get('executionStatusUrl')
                 
-                if del_response.status_code in [200, 202]:
-                    # Get task info from response
-                    result = del_response.json() if del_response.text else {}
-                    task_id = result.get('executionId')
-                    task_url = result.get('executionStatusUrl')
-                    
-                    if task_id:
-                        print(f"  Waiting for deletion task {task_id[:8]}...")
-                        if self.wait_for_task(task_id, task_url):
-                            print(f"✅ Reservation '{reservation_name}' deleted successfully")
-                        else:
-                            print(f"❌ Reservation '{reservation_name}' deletion failed")
-                            return None
+                if task_id:
+                    log.info("  Waiting for deletion task %.8s...", task_id)
+                    if self.wait_for_task(task_id, task_url):
+                        log.info("✅ Reservation '%s' deleted successfully", reservation_name)
                     else:
-                        print(f"✅ Reservation '{reservation_name}' deleted")
-                    
-                    time.sleep(0.5)
-                    return result
+                        log.error("❌ Reservation '%s' deletion failed", reservation_name)
+                        return None
                 else:
-                    print(f"  ❌ Failed (status {del_response.status_code}): {del_response.text[:200]}")
-                    return None
+                    log.info("✅ Reservation '%s' deleted", reservation_name)
+                
+                # Drop just this entry so the site's other deletes reuse the listing
+                self._reservation_cache.get(site_id, {}).pop(reservation_name, None)
+                time.sleep(0.5)
+                return result
+            else:
+                log.error("  ❌ Failed (status %s): %s", del_response.status_code, _error_snippet(del_response))
+                return None
         except Exception as e:
-            print(f"  ❌ Error deleting reservation: {str(e)[:100]}")
+            log.error("  ❌ Error deleting reservation: %.100s", e)
             return None
     
     def delete_global_pool(self, pool_name: str):
         """Delete a global IP pool using /api/v2/ippool endpoint"""
         pool = self.get_global_pool_by_name(pool_name)
         if not pool:
-            print(f"ℹ️  Pool '{pool_name}' not found, skipping")
+            log.info("ℹ️  Pool '%s' not found, skipping", pool_name)
             return None
         
         pool_id = pool["id"]
         # Use /api/v2/ippool endpoint for consistency with create
-        url = f"{self.base_url}/api/v2/ippool/{pool_id}"
+        url = self._urls["ippool_id"] + pool_id
         
-        print(f"Deleting global pool '{pool_name}'...")
-        response = requests.delete(url, headers=self.headers, verify=False, timeout=30)
+        log.info("Deleting global pool '%s'...", pool_name)
+        response = self.session.delete(url, timeout=30)
         
         if response.status_code in [200, 202]:
-            result = response.json() if response.text else {}
+            result = _json_loads(response.content) if response.content else {}
             
             # Get task ID from response (format: {"response": {"taskId": "..."}})
             task_id = result.get('response', {}).get('taskId')
             
             if task_id:
-                print(f"  Waiting for deletion task {task_id[:8]}...")
+                log.info("  Waiting for deletion task %.8s...", task_id)
                 if self.wait_for_task_v2(task_id, timeout=120):
-                    # Verify the pool is actually deleted
-                    time.sleep(2)
-                    if not self.get_global_pool_by_name(pool_name):
-                        print(f"✅ Global pool '{pool_name}' deleted successfully")
+                    # Verify the pool is actually deleted, re-reading the pool list while it propagates
+                    if _wait_until(lambda: pool_name not in self._fetch_pools(refresh=True)):
+                        log.info("✅ Global pool '%s' deleted successfully", pool_name)
                         return result
                     else:
-                        print(f"⚠️  Task completed but pool '{pool_name}' still exists")
+                        log.warning("⚠️  Task completed but pool '%s' still exists", pool_name)
                         return None
                 else:
-                    print(f"❌ Global pool '{pool_name}' deletion failed")
+                    log.error("❌ Global pool '%s' deletion failed", pool_name)
                     return None
             else:
-                print(f"✅ Global pool '{pool_name}' deleted")
+                log.info("✅ Global pool '%s' deleted", pool_name)
             
+            self._pool_cache = None
             time.sleep(1)
             return result
         else:
-            print(f"  ❌ Failed (status {response.status_code}): {response.text[:200]}")
+            log.error("  ❌ Failed (status %s): %s", response.status_code, _error_snippet(response))
             return None
 
 
+# ==========================================================================
+# INFRASTRUCTURE DEFINITION
+# ==========================================================================
+
+class PoolSpec(NamedTuple):
+    name: str
+    cidr: str
+
+
+class BuildingSpec(NamedTuple):
+    name: str
+    parent_name: str
+    latitude: float
+    longitude: float
+    address: str
+    country: str
+
+
+class FloorSpec(NamedTuple):
+    name: str
+    parent_name: str
+    floor_number: int
+
+
+class ReservationSpec(NamedTuple):
+    building: str
+    name: str
+    parent_pool: str
+    subnet: str
+    prefix_length: int
+
+
+GLOBAL_POOLS = [
+    PoolSpec("US_CORP", "10.201.0.0/16"),
+    PoolSpec("US_TECH", "10.202.0.0/16"),
+    PoolSpec("US_GUEST", "10.203.0.0/16"),
+    PoolSpec("US_BYOD", "10.204.0.0/16"),
+]
+
+BUILDINGS = [
+    BuildingSpec("Sunset Tower", "Global/United States/Golden Hills Campus",
+                 34.099, -118.366, "8358 Sunset Blvd, Los Angeles, CA 90069", "United States"),
+    BuildingSpec("Windy City Plaza", "Global/United States/Lakefront Tower",
+                 41.878, -87.630, "233 S Wacker Dr, Chicago, IL 60606", "United States"),
+    BuildingSpec("Art Deco Mansion", "Global/United States/Oceanfront Mansion",
+                 25.782, -80.133, "123 Ocean Drive, Miami Beach, FL 33139", "United States"),
+    BuildingSpec("Desert Oasis Tower", "Global/United States/Desert Oasis Branch",
+                 33.448, -112.074, "1235 Cactus Ave, Phoenix, AZ 85001", "United States"),
+]
+
+# Full hierarchy path of each building, built once from the table above
+BUILDING_PATH = {b.name: f"{b.parent_name}/{b.name}" for b in BUILDINGS}
+
+FLOORS = [
+    FloorSpec("FLOOR_1", BUILDING_PATH["Sunset Tower"], 1),
+    FloorSpec("FLOOR_2", BUILDING_PATH["Sunset Tower"], 2),
+    FloorSpec("FLOOR_1", BUILDING_PATH["Windy City Plaza"], 1),
+    FloorSpec("FLOOR_2", BUILDING_PATH["Windy City Plaza"], 2),
+    FloorSpec("FLOOR_1", BUILDING_PATH["Art Deco Mansion"], 1),
+    FloorSpec("FLOOR_1", BUILDING_PATH["Desert Oasis Tower"], 1),
+]
+
+RESERVATIONS = [
+    ReservationSpec("Sunset Tower", "ST_CORP", "US_CORP", "10.201.2.0", 24),
+    ReservationSpec("Sunset Tower", "ST_TECH", "US_TECH", "10.202.2.0", 24),
+    ReservationSpec("Sunset Tower", "ST_GUEST", "US_GUEST", "10.203.2.0", 24),
+    ReservationSpec("Sunset Tower", "ST_BYOD", "US_BYOD", "10.204.2.0", 24),
+    ReservationSpec("Windy City Plaza", "WCP_CORP", "US_CORP", "10.201.3.0", 24),
+    ReservationSpec("Windy City Plaza", "WCP_TECH", "US_TECH", "10.202.3.0", 24),
+    ReservationSpec("Windy City Plaza", "WCP_GUEST", "US_GUEST", "10.203.3.0", 24),
+    ReservationSpec("Windy City Plaza", "WCP_BYOD", "US_BYOD", "10.204.3.0", 24),
+    ReservationSpec("Art Deco Mansion", "ADM_CORP", "US_CORP", "10.201.4.0", 24),
+    ReservationSpec("Art Deco Mansion", "ADM_TECH", "US_TECH", "10.202.4.0", 24),
+    ReservationSpec("Art Deco Mansion", "ADM_GUEST", "US_GUEST", "10.203.4.0", 24),
+    ReservationSpec("Art Deco Mansion", "ADM_BYOD", "US_BYOD", "10.204.4.0", 24),
+    ReservationSpec("Desert Oasis Tower", "DOT_CORP", "US_CORP", "10.201.1.0", 24),
+    ReservationSpec("Desert Oasis Tower", "DOT_TECH", "US_TECH", "10.202.1.0", 24),
+    ReservationSpec("Desert Oasis Tower", "DOT_GUEST", "US_GUEST", "10.203.1.0", 24),
+    ReservationSpec("Desert Oasis Tower", "DOT_BYOD", "US_BYOD", "10.204.1.0", 24),
+]
+
+
+def _group(specs, key):
+    """Group specs into {key: [specs]}, keeping table order"""
+    groups = {}
+    for spec in specs:
+        groups.setdefault(getattr(spec, key), []).append(spec)
+    return groups
+
+
+def _map_buffered(executor, fn, *iterables):
+    """executor.map whose calls log into private buffers, replayed whole and in input order
+
+    A call that raises still gets its records replayed, as do all later calls; the first
+    exception (in input order) is re-raised once everything has been printed.
+    """
+    def run(*args):
+        _worker_output.records = records = []
+        try:
+            return fn(*args), None, records
+        except Exception as e:
+            return None, e, records
+        finally:
+            _worker_output.records = None
+
+    results = []
+    first_error = None
+    for result, error, records in executor.map(run, *iterables):
+        for record in records:
+            log.handle(record)
+        if error is not None and first_error is None:
+            first_error = error
+        results.append(result)
+    if first_error is not None:
+        raise first_error
+    return results
+
+
 def create_infrastructure(cc):
     """Create all infrastructure"""
-    print("="*70)
-    print("Catalyst Center - Simplified Deployment - CREATE MODE")
-    print("="*70)
+    banner("Catalyst Center - Simplified Deployment - CREATE MODE", before="", after="")
     
     # Create Global IP Pools
-    print("\n" + "="*70)
-    print("📦 Creating Global IP Pools")
-    print("="*70 + "\n")
+    banner("📦 Creating Global IP Pools")
     
-    cc.create_ip_pool("US_CORP", "10.201.0.0/16")
-    cc.create_ip_pool("US_TECH", "10.202.0.0/16")
-    cc.create_ip_pool("US_GUEST", "10.203.0.0/16")
-    cc.create_ip_pool("US_BYOD", "10.204.0.0/16")
+    # Global pools are independent of each other, so create them concurrently
+    with ThreadPoolExecutor(max_workers=4) as executor:
+        _map_buffered(executor, lambda spec: cc.create_ip_pool(*spec), GLOBAL_POOLS)
     
     # Create Areas
-    print("\n" + "="*70)
-    print("🗺️  Creating Areas")
-    print("="*70 + "\n")
+    banner("🗺️  Creating Areas")
     
+    # Parent area first, then its sibling child areas concurrently
     cc.create_area("United States", "Global")
-    cc.create_area("Golden Hills Campus", "Global/United States")
-    cc.create_area("Lakefront Tower", "Global/United States")
-    cc.create_area("Oceanfront Mansion", "Global/United States")
-    cc.create_area("Desert Oasis Branch", "Global/United States")
+    child_areas = [
+        "Golden Hills Campus",
+        "Lakefront Tower",
+        "Oceanfront Mansion",
+        "Desert Oasis Branch",
+    ]
+    with ThreadPoolExecutor(max_workers=4) as executor:
+        _map_buffered(executor, lambda name: cc.create_area(name, "Global/United States"), child_areas)
     
     # Create Buildings
-    print("\n" + "="*70)
-    print("🏢 Creating Buildings")
-    print("="*70 + "\n")
-    
-    cc.create_building(
-        "Sunset Tower",
-        "Global/United States/Golden Hills Campus",
-        34.099, -118.366,
-        "8358 Sunset Blvd, Los Angeles, CA 90069",
-        "United States"
-    )
+    banner("🏢 Creating Buildings")
     
-    cc.create_building(
-        "Windy City Plaza",
-        "Global/United States/Lakefront Tower",
-        41.878, -87.630,
-        "233 S Wacker Dr, Chicago, IL 60606",
-        "United States"
-    )
-    
-    cc.create_building(
-        "Art Deco Mansion",
-        "Global/United States/Oceanfront Mansion",
-        25.782, -80.133,
-        "123 Ocean Drive, Miami Beach, FL 33139",
-        "United States"
-    )
-    
-    cc.create_building(
-        "Desert Oasis Tower",
-        "Global/United States/Desert Oasis Branch",
-        33.448, -112.074,
-        "1235 Cactus Ave, Phoenix, AZ 85001",
-        "United States"
-    )
+    # Buildings sit under different areas, so create them concurrently
+    with ThreadPoolExecutor(max_workers=4) as executor:
+        _map_buffered(executor, lambda spec: cc.create_building(*spec), BUILDINGS)
     
     # Create Floors
-    print("\n" + "="*70)
-    print("🏗️  Creating Floors")
-    print("="*70 + "\n")
+    banner("🏗️  Creating Floors")
+    
+    # One worker per building; floors within a building are created in order
+    def create_floors(floors):
+        for floor in floors:
+            cc.create_floor(*floor)
     
-    cc.create_floor("FLOOR_1", "Global/United States/Golden Hills Campus/Sunset Tower", 1)
-    cc.create_floor("FLOOR_2", "Global/United States/Golden Hills Campus/Sunset Tower", 2)
-    cc.create_floor("FLOOR_1", "Global/United States/Lakefront Tower/Windy City Plaza", 1)
-    cc.create_floor("FLOOR_2", "Global/United States/Lakefront Tower/Windy City Plaza", 2)
-    cc.create_floor("FLOOR_1", "Global/United States/Oceanfront Mansion/Art Deco Mansion", 1)
-    cc.create_floor("FLOOR_1", "Global/United States/Desert Oasis Branch/Desert Oasis Tower", 1)
+    with ThreadPoolExecutor(max_workers=4) as executor:
+        _map_buffered(executor, create_floors, _group(FLOORS, "parent_name").values())
     
     # Create IP Pool Reservations
-    print("\n" + "="*70)
-    print("🔖 Creating IP Pool Reservations")
-    print("="*70 + "\n")
-    
-    # Sunset Tower Reservations
-    print("🏢 Sunset Tower...")
-    cc.reserve_ip_subpool("Sunset Tower", "ST_CORP", "US_CORP", "10.201.2.0", 24)
-    cc.reserve_ip_subpool("Sunset Tower", "ST_TECH", "US_TECH", "10.202.2.0", 24)
-    cc.reserve_ip_subpool("Sunset Tower", "ST_GUEST", "US_GUEST", "10.203.2.0", 24)
-    cc.reserve_ip_subpool("Sunset Tower", "ST_BYOD", "US_BYOD", "10.204.2.0", 24)
-    
-    # Windy City Plaza Reservations
-    print("\n🏢 Windy City Plaza...")
-    cc.reserve_ip_subpool("Windy City Plaza", "WCP_CORP", "US_CORP", "10.201.3.0", 24)
-    cc.reserve_ip_subpool("Windy City Plaza", "WCP_TECH", "US_TECH", "10.202.3.0", 24)
-    cc.reserve_ip_subpool("Windy City Plaza", "WCP_GUEST", "US_GUEST", "10.203.3.0", 24)
-    cc.reserve_ip_subpool("Windy City Plaza", "WCP_BYOD", "US_BYOD", "10.204.3.0", 24)
-    
-    # Art Deco Mansion Reservations
-    print("\n🏢 Art Deco Mansion...")
-    cc.reserve_ip_subpool("Art Deco Mansion", "ADM_CORP", "US_CORP", "10.201.4.0", 24)
-    cc.reserve_ip_subpool("Art Deco Mansion", "ADM_TECH", "US_TECH", "10.202.4.0", 24)
-    cc.reserve_ip_subpool("Art Deco Mansion", "ADM_GUEST", "US_GUEST", "10.203.4.0", 24)
-    cc.reserve_ip_subpool("Art Deco Mansion", "ADM_BYOD", "US_BYOD", "10.204.4.0", 24)
-    
-    # Desert Oasis Tower Reservations
-    print("\n🏢 Desert Oasis Tower...")
-    cc.reserve_ip_subpool("Desert Oasis Tower", "DOT_CORP", "US_CORP", "10.201.1.0", 24)
-    cc.reserve_ip_subpool("Desert Oasis Tower", "DOT_TECH", "US_TECH", "10.202.1.0", 24)
-    cc.reserve_ip_subpool("Desert Oasis Tower", "DOT_GUEST", "US_GUEST", "10.203.1.0", 24)
-    cc.reserve_ip_subpool("Desert Oasis Tower", "DOT_BYOD", "US_BYOD", "10.204.1.0", 24)
+    banner("🔖 Creating IP Pool Reservations")
+    
+    # One worker per building; a building's reservations are made in order
+    def reserve_for_building(building_name, reservations):
+        # Blank line between building blocks; the banner already ends with one before the first
+        separator = "" if building_name == first_building else "\n"
+        log.info("%s🏢 %s...", separator, building_name)
+        for res in reservations:
+            cc.reserve_ip_subpool(*res, site_path=BUILDING_PATH[building_name])
+    
+    reservations_by_building = _group(RESERVATIONS, "building")
+    first_building = next(iter(reservations_by_building))
+    with ThreadPoolExecutor(max_workers=4) as executor:
+        _map_buffered(executor, reserve_for_building, reservations_by_building.keys(), reservations_by_building.values())
     
     # Summary
-    print("\n" + "="*70)
-    print("✅ Deployment Complete!")
-    print("="*70)
+    banner("✅ Deployment Complete!", after="")
     print("\nVerify in Catalyst Center GUI:")
     print("  - Design > Network Hierarchy: Check sites/buildings/floors")
     print("  - Design > Network Settings > IP Address Pools:")
@@ -849,9 +1233,7 @@ def create_infrastructure(cc):
 
 def delete_infrastructure(cc, force=False):
     """Delete all infrastructure in reverse order"""
-    print("="*70)
-    print("Catalyst Center - Simplified Deployment - DELETE MODE")
-    print("="*70)
+    banner("Catalyst Center - Simplified Deployment - DELETE MODE", before="", after="")
     print("\n⚠️  WARNING: This will delete all created infrastructure!")
     print("⚠️  This includes sites, buildings, floors, IP pool reservations,")
     print("⚠️  and global IP pools.")
@@ -869,10 +1251,9 @@ def delete_infrastructure(cc, force=False):
     else:
         print("\n⚡ Force mode enabled, skipping confirmation...")
     
-    # Re-authenticate in case token expired during confirmation
-    print("\n🔐 Re-authenticating...")
+    # The prompt may have sat for a while; refresh only if the token is actually near expiry
     try:
-        cc.authenticate()
+        cc._ensure_token()
     except Exception as e:
         print(f"\n❌ Failed to re-authenticate. Exiting.")
         return 1
@@ -883,128 +1264,128 @@ def delete_infrastructure(cc, force=False):
     # DELETE IP POOL RESERVATIONS FIRST (before deleting sites)
     # ==========================================================================
     
-    print("="*70)
-    print("🔖 Deleting IP Pool Reservations")
-    print("="*70 + "\n")
+    banner("🔖 Deleting IP Pool Reservations", before="")
     
-    # Define all reservations to delete
-    reservations_by_building = {
-        "Sunset Tower": ["ST_CORP", "ST_TECH", "ST_GUEST", "ST_BYOD"],
-        "Windy City Plaza": ["WCP_CORP", "WCP_TECH", "WCP_GUEST", "WCP_BYOD"],
-        "Art Deco Mansion": ["ADM_CORP", "ADM_TECH", "ADM_GUEST", "ADM_BYOD"],
-        "Desert Oasis Tower": ["DOT_CORP", "DOT_TECH", "DOT_GUEST", "DOT_BYOD"],
-    }
-    
-    for building_name, reservations in reservations_by_building.items():
+    for building_name, reservations in _group(RESERVATIONS, "building").items():
         print(f"\n🏢 {building_name}...")
-        for reservation_name in reservations:
-            cc.delete_reservation(building_name, reservation_name)
+        for res in reservations:
+            cc.delete_reservation(building_name, res.name)
     
     # Note: IP pool reservations are automatically deleted when sites are deleted
     
     # Delete Floors (must be deleted before buildings)
-    print("\n" + "="*70)
-    print("🏗️  Deleting Floors")
-    print("="*70 + "\n")
-    
-    # Re-authenticate to ensure fresh token
-    print("🔐 Refreshing authentication...")
-    cc.authenticate()
-    print()
-    
-    floors = [
-        "FLOOR_1",  # Will delete multiple times for different buildings
-        "FLOOR_2",
-    ]
-    
-    # Try deleting FLOOR_1 and FLOOR_2 multiple times (for different buildings)
-    for _ in range(6):  # We have 7 floors total
-        for floor_name in floors:
-            try:
-                result = cc.delete_site(floor_name)
-                if result is None:
-                    break  # No more floors with this name
-            except Exception as e:
-                break
+    banner("🏗️  Deleting Floors")
+    
+    # Floor names repeat across buildings, so find them by building path and delete by ID
+    floors = cc.get_sites_under(*BUILDING_PATH.values())
+    
+    if floors:
+        with ThreadPoolExecutor(max_workers=4) as executor:
+            _map_buffered(
+                executor,
+                lambda floor: cc.delete_site_by_id(floor["id"], floor.get("siteNameHierarchy", floor["name"])),
+                floors
+            )
+    else:
+        print("ℹ️  No floors found")
     
     # Delete Buildings (must be deleted before areas)
-    print("\n" + "="*70)
-    print("🏢 Deleting Buildings")
-    print("="*70 + "\n")
-    
-    # Re-authenticate to ensure fresh token
-    print("🔐 Refreshing authentication...")
-    cc.authenticate()
-    
-    buildings = [
-        "Sunset Tower",
-        "Windy City Plaza",
-        "Art Deco Mansion",
-        "Desert Oasis Tower",
-    ]
+    banner("🏢 Deleting Buildings")
+    
+    # Buildings are independent of each other once their floors are gone
+    def delete_building(name, path):
+        site = cc.get_site_by_path(path)
+        if site:
+            cc.delete_site_by_id(site["id"], name)
+        else:
+            log.info("ℹ️  Site '%s' not found, skipping", name)
     
-    for building in buildings:
-        cc.delete_site(building)
+    with ThreadPoolExecutor(max_workers=4) as executor:
+        _map_buffered(executor, delete_building, BUILDING_PATH.keys(), BUILDING_PATH.values())
     
     # Delete Areas (delete children first, then parents)
-    print("\n" + "="*70)
-    print("🗺️  Deleting Areas")
-    print("="*70 + "\n")
-    
-    # Re-authenticate again
-    print("🔐 Refreshing authentication...")
-    cc.authenticate()
+    banner("🗺️  Deleting Areas")
     
-    areas = [
+    # Sibling child areas concurrently, then the parent area once they are all gone
+    child_areas = [
         "Golden Hills Campus",
         "Lakefront Tower",
         "Oceanfront Mansion",
         "Desert Oasis Branch",
-        "United States",  # Parent area last
     ]
-    
-    for area in areas:
-        cc.delete_site(area)
+    with ThreadPoolExecutor(max_workers=4) as executor:
+        _map_buffered(executor, cc.delete_site, child_areas)
+    cc.delete_site("United States")
     
     # Delete Global IP Pools
-    print("\n" + "="*70)
-    print("📦 Deleting Global IP Pools")
-    print("="*70 + "\n")
-    
-    # Re-authenticate to ensure fresh token
-    print("🔐 Refreshing authentication...")
-    cc.authenticate()
+    banner("📦 Deleting Global IP Pools")
     
-    for pool_name in ["US_CORP", "US_TECH", "US_GUEST", "US_BYOD"]:
+    for pool_name in (pool.name for pool in GLOBAL_POOLS):
         try:
             cc.delete_global_pool(pool_name)
         except Exception as e:
             print(f"  ⚠️  Error deleting pool '{pool_name}': {str(e)[:100]}")
     
-    print("\n" + "="*70)
-    print("✅ Deletion Complete!")
-    print("="*70)
+    banner("✅ Deletion Complete!", after="")
     print()
     
     return 0
 
 
+def _get_global_pools(cc):
+    """GET the global pool list for the status report"""
+    response = cc.session.get(cc._urls["pool"], timeout=30)
+    response.raise_for_status()
+    return _json_loads(response.content).get('response', [])
+
+
+def _get_all_sites(cc):
+    """Yield every site for the status report, streamed so parsing overlaps classification"""
+    return cc._iter_response_items(cc._urls["site"])
+
+
+def _classify_sites(sites):
+    """Bucket sites by type in one pass; returns (site count incl. Global, {'area': [...], 'building': [...], 'floor': [...]})"""
+    sites_by_type = {'area': [], 'building': [], 'floor': []}
+    site_count = 0
+    for site in sites:
+        site_count += 1
+        if site.get('name', '') == 'Global':
+            continue  # Skip root
+        
+        # Type lives in the "Location" namespace of additionalInfo
+        info_by_ns = {info.get('nameSpace'): info.get('attributes') or {} for info in site.get('additionalInfo') or ()}
+        site_type = info_by_ns.get('Location', {}).get('type')
+        
+        # If that fails, fall back to the depth of siteNameHierarchy
+        if not site_type:
+            parts = site.get('siteNameHierarchy', '').count('/')
+            if parts in (1, 2):
+                site_type = 'area'
+            elif parts == 3:
+                site_type = 'building'
+            elif parts >= 4:
+                site_type = 'floor'
+        
+        if site_type in sites_by_type:
+            sites_by_type[site_type].append(site)
+    return site_count, sites_by_type
+
+
 def check_infrastructure(cc):
     """Check and display existing infrastructure"""
-    print("="*70)
-    print("Catalyst Center - Infrastructure Status")
-    print("="*70)
+    banner("Catalyst Center - Infrastructure Status", before="", after="")
+    
+    # Pools and sites don't depend on each other, so fetch both at once; errors surface in each section
+    with ThreadPoolExecutor(max_workers=2) as executor:
+        pools_future = executor.submit(_get_global_pools, cc)
+        sites_future = executor.submit(lambda: _classify_sites(_get_all_sites(cc)))
     
     # Check Global IP Pools
-    print("\n" + "="*70)
-    print("📦 Global IP Pools")
-    print("="*70)
+    banner("📦 Global IP Pools", after="")
     
     try:
-        pools_url = f"{cc.base_url}/dna/intent/api/v1/global-pool"
-        response = requests.get(pools_url, headers=cc.headers, verify=False, timeout=30)
-        response.raise_for_status()
-        pools = response.json().get('response', [])
+        pools = pools_future.result()
         
         if pools:
             print(f"\nFound {len(pools)} global pool(s):")
@@ -1021,60 +1402,19 @@ def check_infrastructure(cc):
         print(f"\n  ❌ Error checking pools: {e}")
     
     # Check Sites
-    print("\n" + "="*70)
-    print("🗺️  Site Hierarchy")
-    print("="*70)
+    banner("🗺️  Site Hierarchy", after="")
     
+    # Fetched and classified once here, then reused by the reservations section
+    sites_by_type = None
     try:
-        sites_url = f"{cc.base_url}/dna/intent/api/v1/site"
-        response = requests.get(sites_url, headers=cc.headers, verify=False, timeout=30)
-        response.raise_for_status()
-        sites = response.json().get('response', [])
+        site_count, sites_by_type = sites_future.result()
         
-        if sites:
-            # Organize by type - use a safer approach
-            areas = []
-            buildings = []
-            floors = []
-            
-            for site in sites:
-                site_name = site.get('name', '')
-                if site_name == 'Global':
-                    continue  # Skip root
-                
-                # Try to determine type from additionalInfo
-                site_type = None
-                try:
-                    if 'additionalInfo' in site and site['additionalInfo']:
-                        for info in site['additionalInfo']:
-                            if 'attributes' in info and 'type' in info['attributes']:
-                                site_type = info['attributes']['type']
-                                break
-                except Exception:
-                    pass
-                
-                # If that fails, use groupNameHierarchy or nameHierarchy
-                if not site_type:
-                    hierarchy = site.get('siteNameHierarchy', '')
-                    parts = hierarchy.count('/')
-                    if parts == 1:
-                        site_type = 'area'
-                    elif parts == 2:
-                        site_type = 'area'
-                    elif parts == 3:
-                        site_type = 'building'
-                    elif parts >= 4:
-                        site_type = 'floor'
-                
-                # Categorize
-                if site_type == 'area':
-                    areas.append(site)
-                elif site_type == 'building':
-                    buildings.append(site)
-                elif site_type == 'floor':
-                    floors.append(site)
+        if site_count:
+            areas = sites_by_type['area']
+            buildings = sites_by_type['building']
+            floors = sites_by_type['floor']
             
-            print(f"\nFound {len(sites)-1} site(s) (excluding Global):")
+            print(f"\nFound {site_count-1} site(s) (excluding Global):")
             
             if areas:
                 print(f"\n  Areas ({len(areas)}):")
@@ -1105,74 +1445,55 @@ def check_infrastructure(cc):
         print(f"\n  ❌ Error checking sites: {e}")
     
     # Check IP Pool Reservations
-    print("\n" + "="*70)
-    print("🔖 IP Pool Reservations")
-    print("="*70)
+    banner("🔖 IP Pool Reservations", after="")
     
     try:
-        # Get all building sites
-        sites_url = f"{cc.base_url}/dna/intent/api/v1/site"
-        response = requests.get(sites_url, headers=cc.headers, verify=False, timeout=30)
-        response.raise_for_status()
-        all_sites = response.json().get('response', [])
-        
-        # Find buildings using safer approach
-        buildings = []
-        for site in all_sites:
-            site_type = None
-            try:
-                if 'additionalInfo' in site and site['additionalInfo']:
-                    for info in site['additionalInfo']:
-                        if 'attributes' in info and 'type' in info['attributes']:
-                            site_type = info['attributes']['type']
-                            break
-            except Exception:
-                pass
-            
-            # Fallback to hierarchy depth
-            if not site_type:
-                hierarchy = site.get('siteNameHierarchy', '')
-                parts = hierarchy.count('/')
-                if parts == 3:
-                    site_type = 'building'
-            
-            if site_type == 'building':
-                buildings.append(site)
+        # Buildings come from the classification above (redone only if that section failed)
+        if sites_by_type is None:
+            _, sites_by_type = _classify_sites(_get_all_sites(cc))
+        buildings = sites_by_type['building']
         
         total_reservations = 0
         if buildings:
-            for building in buildings:
-                building_name = building['name']
-                building_id = building['id']
-                
-                # Try to get reservations for this building
+            def fetch_reservations(building):
+                """GET one building's reservations; returns (reservations, error)"""
                 try:
-                    # Use the correct v1 endpoint with query parameter
-                    res_url = f"{cc.base_url}/dna/intent/api/v1/reserve-ip-subpool?siteId={building_id}"
-                    res_response = requests.get(res_url, headers=cc.headers, verify=False, timeout=30)
-                    
-                    if res_response.status_code == 200:
-                        data = res_response.json()
-                        reservations = data.get('response', [])
-                        if reservations:
-                            print(f"\n  {building_name} ({len(reservations)} reservation(s)):")
-                            for res in reservations:
-                                # The structure has groupName and nested ipPools
-                                res_name = res.get('groupName', 'Unknown')
-                                # Get the first IP pool details
-                                ip_pools = res.get('ipPools', [])
-                                if ip_pools:
-                                    pool = ip_pools[0]
-                                    res_cidr = pool.get('ipPoolCidr', 'N/A')
-                                    used = pool.get('usedIpAddressCount', 0)
-                                    total = pool.get('totalIpAddressCount', 0)
-                                    print(f"    • {res_name}: {res_cidr} ({used}/{total} used)")
-                                else:
-                                    print(f"    • {res_name}")
-                                total_reservations += 1
+                    res_response = cc.session.get(cc._urls["reservations"] + building['id'], timeout=30)
+                    res_response.raise_for_status()
+                    return _json_loads(res_response.content).get('response', []), None
                 except Exception as e:
-                    pass  # Skip buildings with no reservations or errors
+                    return None, e
+            
+            # Fetch every building's reservations concurrently, then print in building order
+            with ThreadPoolExecutor(max_workers=8) as executor:
+                results = list(executor.map(fetch_reservations, buildings))
+            
+            failed = 0
+            for building, (reservations, error) in zip(buildings, results):
+                building_name = building['name']
+                if error is not None:
+                    # Not the same as "no reservations": the building could not be checked
+                    print(f"\n  ⚠️  {building_name}: could not fetch reservations ({str(error)[:100]})")
+                    failed += 1
+                elif reservations:
+                    print(f"\n  {building_name} ({len(reservations)} reservation(s)):")
+                    for res in reservations:
+                        # The structure has groupName and nested ipPools
+                        res_name = res.get('groupName', 'Unknown')
+                        # Get the first IP pool details
+                        ip_pools = res.get('ipPools', [])
+                        if ip_pools:
+                            pool = ip_pools[0]
+                            res_cidr = pool.get('ipPoolCidr', 'N/A')
+                            used = pool.get('usedIpAddressCount', 0)
+                            total = pool.get('totalIpAddressCount', 0)
+                            print(f"    • {res_name}: {res_cidr} ({used}/{total} used)")
+                        else:
+                            print(f"    • {res_name}")
+                        total_reservations += 1
             
+            if failed:
+                print(f"\n  ⚠️  {failed} building(s) could not be checked; counts below may be incomplete")
             if total_reservations == 0:
                 print("\n  ℹ️  No IP pool reservations found")
             else:
@@ -1183,9 +1504,7 @@ def check_infrastructure(cc):
         print(f"\n  ❌ Error checking reservations: {e}")
     
     # Summary
-    print("\n" + "="*70)
-    print("✅ Status Check Complete")
-    print("="*70)
+    banner("✅ Status Check Complete", after="")
     print()
     
     return 0
@@ -1214,24 +1533,55 @@ Configuration:
   See CC_Env_Sample.yml for a template.
         """
     )
-    parser.add_argument(
-        'action',
-        choices=['create', 'delete', 'status'],
-        help='Action to perform: create, delete, or check status of infrastructure'
-    )
-    parser.add_argument(
+    
+    # Options shared by every action
+    common = argparse.ArgumentParser(add_help=False)
+    common.add_argument(
         '--config',
         required=True,
         help='Path to YAML configuration file (required)'
     )
-    parser.add_argument(
-        '--force', '-f',
+    common.add_argument(
+        '--http2',
+        action='store_true',
+        help='Use a single multiplexed HTTP/2 connection (requires httpx[http2])'
+    )
+    common.add_argument(
+        '--verbose', '-v',
+        action='store_true',
+        help='Show task polling progress'
+    )
+    
+    # Each action declares its own options and the function that runs it
+    actions = parser.add_subparsers(
+        dest='action',
+        required=True,
+        metavar='{create,delete,status}',
+        help='Action to perform: create, delete, or check status of infrastructure'
+    )
+    create_parser = actions.add_parser('create', parents=[common], help='Create all infrastructure')
+    create_parser.set_defaults(func=lambda cc, args: create_infrastructure(cc))
+    
+    delete_parser = actions.add_parser('delete', parents=[common], help='Delete all infrastructure')
+    delete_parser.add_argument(
+        '--force', '-f', '--yes', '-y',
         action='store_true',
-        help='Skip confirmation prompt for delete operation'
+        help='Skip confirmation prompt'
     )
+    delete_parser.set_defaults(func=lambda cc, args: delete_infrastructure(cc, force=args.force))
+    
+    status_parser = actions.add_parser('status', parents=[common], help='Show current sites and IP pools')
+    status_parser.set_defaults(func=lambda cc, args: check_infrastructure(cc))
     
     args = parser.parse_args()
     
+    # API client messages go to stdout alongside the report, without logging decorations
+    handler = logging.StreamHandler(sys.stdout)
+    handler.setFormatter(logging.Formatter("%(message)s"))
+    log.handlers[:] = [handler]
+    log.setLevel(logging.DEBUG if args.verbose else logging.INFO)
+    log.propagate = False
+    
     # Load credentials from YAML file
     print("🔍 Loading credentials...")
     config = load_credentials_from_yaml(args.config)
@@ -1245,11 +1595,17 @@ Configuration:
     print(f"✅ Loaded credentials from {args.config}")
     
     # Initialize API client
-    cc = CatalystCenterAPI(
-        base_url=config['base_url'],
-        username=config['username'],
-        password=config['password']
-    )
+    try:
+        cc = CatalystCenterAPI(
+            base_url=config['base_url'],
+            username=config['username'],
+            password=config['password'],
+            verify_ssl=config['verify_ssl'],
+            http2=args.http2
+        )
+    except ImportError as e:
+        print(f"❌ {e}")
+        return 1
     
     # Authenticate
     print("\n🔐 Authenticating...")
@@ -1260,15 +1616,7 @@ Configuration:
         return 1
     
     # Execute requested action
-    if args.action == 'create':
-        return create_infrastructure(cc)
-    elif args.action == 'delete':
-        return delete_infrastructure(cc, force=args.force)
-    elif args.action == 'status':
-        return check_infrastructure(cc)
-    else:
-        print(f"❌ Unknown action: {args.action}")
-        return 1
+    return args.func(cc, args)
 
 
 if __name__ == "__main__":